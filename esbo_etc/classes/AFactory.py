@@ -1,9 +1,6 @@
 from abc import abstractmethod
 from .Entry import Entry
 from .IRadiant import IRadiant
-from ..lib.logger import logger
-import copy
-import re
 
 
 class AFactory:
@@ -55,22 +52,15 @@ class AFactory:
         opts : dict
             The collected options as dictionary
         """
-        # if hasattr(options, "type"):
-        # Copy custom attributes of the Entry to a dictionary
-        opts = copy.copy(vars(options))
-
-        for i in vars(options):
-            obj = getattr(options, i)
+        # Copy the plain attributes of the Entry to a dictionary and merge the options of nested entries
+        attributes = vars(options)
+        opts = {key: obj for key, obj in attributes.items() if not isinstance(obj, Entry)}
+        for key, obj in attributes.items():
             if isinstance(obj, Entry):
-                opts.pop(i, None)
                 additional_opts = self.collectOptions(obj)
-                if len(additional_opts) == 1 and list(additional_opts.keys())[0] == "val":
-                    additional_opts[i] = additional_opts.pop("val")
+                if len(additional_opts) == 1 and "val" in additional_opts:
+                    additional_opts[key] = additional_opts.pop("val")
                 opts.update(additional_opts)
 
         # Remove unnecessary keys
-        for attrib in list(filter(re.compile(".*_unit$").match, opts)) + ["comment", "type"]:
-            opts.pop(attrib, None)
-        return opts
-        # else:
-        #     logger.error("Component needs to have a type specified.")
+        return {key: obj for key, obj in opts.items() if not key.endswith("_unit") and key not in ("comment", "type")}
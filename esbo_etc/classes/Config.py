@@ -10,6 +10,7 @@ from ..classes import target as tg
 from ..classes import optical_component as oc
 from ..classes import sensor as sensor
 import difflib
+import copy
 import os.path
 from typing import Union
 
@@ -25,6 +26,10 @@ class Configuration(object):
         Parsed configuration file as Entry-tree
     """
     conf = None
+    # Parsed and checked configurations, keyed by the file's path, modification time and size
+    __cache = dict()
+    # Maximum number of cached configurations
+    __CACHE_SIZE = 8
 
     def __init__(self, file="esbo-etc_defaults.xml"):
         """
@@ -40,13 +45,56 @@ class Configuration(object):
         if not os.path.exists(file):
             logger.error("Configuration file '" + file + "' doesn't exist.")
 
+        # Reuse the configuration if neither the file nor the files referenced by it were modified since parsing
+        stat = os.stat(file)
+        key = (os.path.abspath(file), os.getcwd(), stat.st_mtime_ns, stat.st_size)
+        if key in Configuration.__cache:
+            conf, files, stats = Configuration.__cache[key]
+            if self.__stat_files(files) == stats:
+                logger.info("Using cached configuration from file '" + file + "'.")
+                self.conf = copy.deepcopy(conf)
+                return
+            del Configuration.__cache[key]
+
         # Read configuration file
         logger.info("Reading configuration from file '" + file + "'.")
-        self.conf = self.__parser(eT.parse(file).getroot())
+        root = eT.parse(file).getroot()
+        self.conf = self.__parser(root)
 
         self.__check_config()
         self.__calc_metaoptions()
 
+        # Cache the configuration together with the state of all referenced files
+        files = tuple(sorted(set(os.path.abspath(x) for element in root.iter() for x in element.attrib.values()
+                                 if os.path.isfile(x))))
+        if len(Configuration.__cache) >= Configuration.__CACHE_SIZE:
+            del Configuration.__cache[next(iter(Configuration.__cache))]
+        Configuration.__cache[key] = (copy.deepcopy(self.conf), files, self.__stat_files(files))
+
+    @staticmethod
+    def __stat_files(files: tuple) -> tuple:
+        """
+        Get the modification time and size of files
+
+        Parameters
+        ----------
+        files : tuple
+            The paths of the files.
+
+        Returns
+        -------
+        stats : tuple
+            The modification time and size of each file or None if the file doesn't exist.
+        """
+        stats = []
+        for file in files:
+            try:
+                stat = os.stat(file)
+                stats.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stats.append(None)
+        return tuple(stats)
+
     def __parser(self, parent: eT.Element):
         """
         Parse a XML element tree to an Entry-tree
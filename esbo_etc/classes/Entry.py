@@ -22,6 +22,13 @@ class Entry(object):
     def __call__(self):
         return self.val if hasattr(self, "val") else None
 
+    @property
+    def _keys(self) -> frozenset:
+        """
+        The names of all attributes and sub-entries present in this entry.
+        """
+        return frozenset(self.__dict__)
+
     def parse(self, xml: eT.Element):
         """
         Parse attributes of a XML element
@@ -207,3 +214,49 @@ class Entry(object):
             setattr(self, name, float(attr))
         else:
             return "Expected parameter '" + name + "' to be numeric but got '" + type(attr) + "' instead."
+
+    def check_file_or_float(self, name) -> Union[None, str]:
+        """
+        Check a parameter to be either a floating point value or a valid path to a file. The numeric value is checked
+        first, as it doesn't require to access the file system.
+
+        Parameters
+        ----------
+        name : str
+            The name of the parameter to be checked.
+
+        Returns
+        -------
+        mes : Union[None, str]
+            The error message of the check. This will be None if the check was successful.
+        """
+        mes = self.check_float(name)
+        if mes is not None and type(getattr(self, name, None)) == str and self.check_file(name) is None:
+            return None
+        return mes
+
+    def check_all(self, checks: list) -> Union[None, str]:
+        """
+        Check multiple parameters using the check methods of this class
+
+        Parameters
+        ----------
+        checks : list
+            The checks to be performed as tuples of the name of the parameter, the kind of the check (e.g. 'quantity'
+            for the method check_quantity), a tuple of the additional arguments of the check and a flag whether the
+            parameter is optional.
+
+        Returns
+        -------
+        mes : Union[None, str]
+            The error message of the first failing check. This will be None if all checks were successful.
+        """
+        # Look up the present parameters once instead of querying each attribute
+        keys = self._keys
+        for name, kind, args, optional in checks:
+            if optional and name not in keys:
+                continue
+            mes = getattr(self, "check_" + kind)(name, *args)
+            if mes is not None:
+                return mes
+        return None
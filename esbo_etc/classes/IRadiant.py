@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from .SpectralQty import SpectralQty
-from typing import Tuple
+from typing import Tuple, List
 
 
 class IRadiant(ABC):
@@ -33,3 +33,14 @@ class IRadiant(ABC):
             The emitted, reflected or transmitted background radiation
         """
         pass
+
+    def chain(self) -> List["IRadiant"]:
+        """
+        Collect the components of the beam up to and including this component
+
+        Returns
+        -------
+        chain : List[IRadiant]
+            The components of the beam ordered from the source to this component
+        """
+        return [self]
@@ -2,10 +2,11 @@ from ..lib.helpers import isLambda, readCSV
 from ..lib.logger import logger
 from scipy.interpolate import interp1d
 import astropy.units as u
-from typing import Union, Callable
+from typing import Union, Callable, Tuple
 import os
 from scipy.integrate import trapz
 import numpy as np
+from functools import lru_cache
 
 
 # noinspection PyUnresolvedReferences
@@ -13,6 +14,8 @@ class SpectralQty:
     """
     A class to hold and work with spectral quantities
     """
+    # Let numpy and astropy defer to the reflected operators of this class instead of broadcasting over it
+    __array_ufunc__ = None
 
     def __init__(self, wl: u.Quantity, qty: u.Quantity, fill_value: Union[bool, int, float] = 0):
         """
@@ -47,6 +50,8 @@ class SpectralQty:
         else:
             logger.error("Lengths not matching")
         self._fill_value = fill_value
+        # The last rebinned spectral quantity together with the wavelength grid it was rebinned to
+        self.__rebinned = None
 
     @classmethod
     def fromFile(cls, file: str, wl_unit_default: u.Quantity = None, qty_unit_default: u.Quantity = None,
@@ -73,10 +78,56 @@ class SpectralQty:
         sqty : SpectralQty
             The created spectral quantity.
         """
-        # Read the file
+        # Read the file. The parsed file is shared as long as it isn't modified.
+        wl, qty = SpectralQty.__readFile(os.path.abspath(file), os.stat(file).st_mtime_ns, wl_unit_default,
+                                         qty_unit_default)
+        return cls(wl, qty, fill_value=fill_value)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def __readFile(file: str, mtime: int, wl_unit_default: u.Quantity = None,
+                   qty_unit_default: u.Quantity = None) -> Tuple[u.Quantity, u.Quantity]:
+        """
+        Read the wavelengths and the values of a spectral quantity from a file. As the results are cached, they are
+        returned as read-only quantities.
+
+        Parameters
+        ----------
+        file : str
+            Absolute path to the file to read the values from.
+        mtime : int
+            Modification time of the file in ns, used to invalidate the cache.
+        wl_unit_default : Quantity
+            Default unit to be used for the wavelength column if no units are provided by the file.
+        qty_unit_default : Quantity
+            Default unit to be used for the quantity column if no units are provided by the file.
+
+        Returns
+        -------
+        wl : Quantity
+            The read wavelengths.
+        qty : Quantity
+            The read values of the spectral quantity.
+        """
         data = readCSV(file, [wl_unit_default, qty_unit_default] if wl_unit_default is not None and
                        qty_unit_default is not None else None)
-        return cls(data[data.colnames[0]].quantity, data[data.colnames[1]].quantity, fill_value=fill_value)
+        wl = data[data.colnames[0]].quantity.copy()
+        qty = data[data.colnames[1]].quantity.copy()
+        wl.flags.writeable = False
+        qty.flags.writeable = False
+        return wl, qty
+
+    def copy(self) -> "SpectralQty":
+        """
+        Create a copy of this spectral quantity. Only the values are copied, the wavelengths are shared as they are
+        never modified in place.
+
+        Returns
+        -------
+        sqty : SpectralQty
+            The copied spectral quantity.
+        """
+        return SpectralQty(self.wl, self.qty.copy(), fill_value=self._fill_value)
 
     def __str__(self, precision: int = 4) -> str:
         """
@@ -118,8 +169,8 @@ class SpectralQty:
         """
         return self.wl.unit.is_equivalent(other.wl.unit) and self.qty.unit.is_equivalent(other.qty.unit) and \
             len(self.wl) == len(other.wl) and len(self.qty) == len(other.qty) and \
-            np.allclose(self.wl.value, other.wl.to(self.wl.unit).value) and \
-            np.allclose(self.qty.value, other.qty.to(self.qty.unit).value)
+            np.allclose(self.wl.value, other.wl.to_value(self.wl.unit)) and \
+            np.allclose(self.qty.value, other.qty.to_value(self.qty.unit))
 
     def __add__(self, other: Union[int, float, u.Quantity, "SpectralQty", Callable[[u.Quantity], u.Quantity]]) ->\
             "SpectralQty":
@@ -157,12 +208,13 @@ class SpectralQty:
                     return SpectralQty(self.wl, self.qty + other.qty)
                 else:
                     # Wavelengths are not matching, rebinning needed
-                    other_rebinned = other.rebin(self.wl)
+                    other_rebinned = other.__rebinShared(self.wl)
                     if len(self.wl) == len(other_rebinned.wl) and (self.wl == other_rebinned.wl).all():
                         return SpectralQty(self.wl, self.qty + other_rebinned.qty)
                     else:
                         # Wavelengths are still not matching as extrapolation is disabled, rebin this spectral quantity
-                        return SpectralQty(other_rebinned.wl, self.rebin(other_rebinned.wl).qty + other_rebinned.qty)
+                        self_rebinned = self.__rebinShared(other_rebinned.wl)
+                        return SpectralQty(other_rebinned.wl, self_rebinned.qty + other_rebinned.qty)
             else:
                 logger.error("Units are not matching for addition.")
 
@@ -205,15 +257,46 @@ class SpectralQty:
                 # Wavelengths are not matching, rebinning needed
                 else:
                     # Rebin subtrahend
-                    other_rebinned = other.rebin(self.wl)
+                    other_rebinned = other.__rebinShared(self.wl)
                     if len(self.wl) == len(other_rebinned.wl) and (self.wl == other_rebinned.wl).all():
                         return SpectralQty(self.wl, self.qty - other_rebinned.qty)
                     else:
                         # Wavelengths are still not matching as extrapolation is disabled, rebin this spectral quantity
-                        return SpectralQty(other_rebinned.wl, self.rebin(other_rebinned.wl).qty - other_rebinned.qty)
+                        self_rebinned = self.__rebinShared(other_rebinned.wl)
+                        return SpectralQty(other_rebinned.wl, self_rebinned.qty - other_rebinned.qty)
             else:
                 logger.error("Units are not matching for substraction.")
 
+    def __rsub__(self, other: Union[int, float, u.Quantity, Callable[[u.Quantity], u.Quantity]]) -> "SpectralQty":
+        """
+        Calculate the difference of another object to this object
+
+        Parameters
+        ----------
+        other : Union[int, float, u.Quantity, Callable]
+            Minuend to subtract this object from.
+
+        Returns
+        -------
+        diff : SpectralQty
+            The difference of both objects
+        """
+        # Minuend is of type int or float, use same unit
+        if isinstance(other, int) or isinstance(other, float):
+            # Subtract from the plain values in a single pass, e.g. for emissivities derived from transmittances
+            return SpectralQty(self.wl, np.subtract(other, self.qty.value) << self.qty.unit)
+        # Minuend is of type Quantity
+        elif isinstance(other, u.Quantity):
+            if other.unit == self.qty.unit:
+                return SpectralQty(self.wl, other - self.qty)
+            else:
+                raise TypeError('Units are not matching for subtraction.')
+        # Minuend is of type lambda
+        elif isLambda(other):
+            return SpectralQty(self.wl, other(self.wl).value * other(self.wl[0]).unit - self.qty)
+        else:
+            logger.error("Unsupported type for subtraction.")
+
     def __mul__(self, other: Union[int, float, u.Quantity, "SpectralQty", Callable[[u.Quantity], u.Quantity]]) ->\
             "SpectralQty":
         """
@@ -245,17 +328,90 @@ class SpectralQty:
                 # Wavelengths are not matching, rebinning needed
                 else:
                     # Rebin factor
-                    other_rebinned = other.rebin(self.wl)
+                    other_rebinned = other.__rebinShared(self.wl)
                     if len(self.wl) == len(other_rebinned.wl) and (self.wl == other_rebinned.wl).all():
                         return SpectralQty(self.wl, self.qty * other_rebinned.qty)
                     else:
                         # Wavelengths are still not matching as extrapolation is disabled, rebin this spectral quantity
-                        return SpectralQty(other_rebinned.wl, self.rebin(other_rebinned.wl).qty * other_rebinned.qty)
+                        self_rebinned = self.__rebinShared(other_rebinned.wl)
+                        return SpectralQty(other_rebinned.wl, self_rebinned.qty * other_rebinned.qty)
             else:
                 logger.error("Units are not matching for multiplication.")
 
     __rmul__ = __mul__
 
+    def imul(self, other: Union[int, float, u.Quantity, "SpectralQty", Callable[[u.Quantity], u.Quantity]]) ->\
+            "SpectralQty":
+        """
+        Multiply this object in place with a dimensionless factor. If the values of this object are read-only, the
+        factor is not dimensionless or rebinning is required, the product is calculated out of place.
+
+        Parameters
+        ----------
+        other : Union[int, float, u.Quantity, "SpectralQty", Callable]
+            Factor to be multiplied with this object.
+
+        Returns
+        -------
+        prod : SpectralQty
+            The product of both objects. This is the modified object itself if the multiplication was done in place.
+        """
+        factor = None
+        if isinstance(other, int) or isinstance(other, float):
+            factor = other
+        elif isinstance(other, u.Quantity):
+            if other.unit == u.dimensionless_unscaled and other.shape in [(), self.qty.shape]:
+                factor = other.value
+        elif isLambda(other):
+            res = other(self.wl)
+            if isinstance(res, u.Quantity) and res.unit == u.dimensionless_unscaled:
+                factor = res.value
+        elif isinstance(other, SpectralQty):
+            if other.qty.unit == u.dimensionless_unscaled and len(self.wl) == len(other.wl) and \
+                    (self.wl == other.wl).all():
+                factor = other.qty.value
+        if factor is None or not self.qty.flags.writeable:
+            return self * other
+        np.multiply(self.qty.value, factor, out=self.qty.value)
+        self.__rebinned = None
+        return self
+
+    def iadd(self, other: Union[int, float, u.Quantity, "SpectralQty", Callable[[u.Quantity], u.Quantity]]) ->\
+            "SpectralQty":
+        """
+        Add another object in place to this object. If the values of this object are read-only, the units are not
+        convertible or rebinning is required, the sum is calculated out of place.
+
+        Parameters
+        ----------
+        other : Union[int, float, u.Quantity, "SpectralQty", Callable]
+            Addend to be added to this object.
+
+        Returns
+        -------
+        sum : SpectralQty
+            The sum of both objects. This is the modified object itself if the addition was done in place.
+        """
+        addend = None
+        if isinstance(other, int) or isinstance(other, float):
+            addend = other
+        elif isinstance(other, u.Quantity):
+            if other.unit == self.qty.unit and other.shape in [(), self.qty.shape]:
+                addend = other.value
+        elif isLambda(other):
+            res = other(self.wl)
+            if isinstance(res, u.Quantity) and res.unit.is_equivalent(self.qty.unit):
+                addend = res.to_value(self.qty.unit)
+        elif isinstance(other, SpectralQty):
+            if other.qty.unit.is_equivalent(self.qty.unit) and len(self.wl) == len(other.wl) and \
+                    (self.wl == other.wl).all():
+                addend = other.qty.to_value(self.qty.unit)
+        if addend is None or not self.qty.flags.writeable:
+            return self + other
+        np.add(self.qty.value, addend, out=self.qty.value)
+        self.__rebinned = None
+        return self
+
     def __truediv__(self, other: Union[int, float, u.Quantity, "SpectralQty", Callable[[u.Quantity], u.Quantity]]) ->\
             "SpectralQty":
         """
@@ -287,12 +443,13 @@ class SpectralQty:
                 # Wavelengths are not matching, rebinning needed
                 else:
                     # Rebin factor
-                    other_rebinned = other.rebin(self.wl)
+                    other_rebinned = other.__rebinShared(self.wl)
                     if len(self.wl) == len(other_rebinned.wl) and (self.wl == other_rebinned.wl).all():
                         return SpectralQty(self.wl, self.qty / other_rebinned.qty)
                     else:
                         # Wavelengths are still not matching as extrapolation is disabled, rebin this spectral quantity
-                        return SpectralQty(other_rebinned.wl, self.rebin(other_rebinned.wl).qty / other_rebinned.qty)
+                        self_rebinned = self.__rebinShared(other_rebinned.wl)
+                        return SpectralQty(other_rebinned.wl, self_rebinned.qty / other_rebinned.qty)
             else:
                 logger.error("Units are not matching for division.")
 
@@ -319,6 +476,46 @@ class SpectralQty:
         Resample the spectral quantity sqty(wl) over the new grid wl, rebinning if necessary, otherwise interpolates.
         Copied from ExoSim (https://github.com/ExoSim/ExoSimPublic).
 
+        Parameters
+        ----------
+        wl : Quantity
+            new binned wavelengths
+
+        Returns
+        -------
+        sqty : SpectralQty
+            The rebinned spectral quantity
+        """
+        rebinned = self.__rebinShared(wl)
+        return SpectralQty(rebinned.wl, rebinned.qty.copy())
+
+    def __rebinShared(self, wl: u.Quantity) -> "SpectralQty":
+        """
+        Resample the spectral quantity over the new grid wl. The result for the last grid is kept, as components are
+        usually rebinned repeatedly to the same grid. It is therefore returned as read-only spectral quantity, which
+        must not be handed out of this class.
+
+        Parameters
+        ----------
+        wl : Quantity
+            new binned wavelengths
+
+        Returns
+        -------
+        sqty : SpectralQty
+            The rebinned spectral quantity
+        """
+        if self.__rebinned is not None and self.__rebinned[0] is wl and np.array_equal(self.__rebinned[1], wl.value):
+            return self.__rebinned[2]
+        rebinned = self.__rebin(wl)
+        rebinned.qty.flags.writeable = False
+        self.__rebinned = (wl, wl.value.copy(), rebinned)
+        return rebinned
+
+    def __rebin(self, wl: u.Quantity) -> "SpectralQty":
+        """
+        Resample the spectral quantity sqty(wl) over the new grid wl, rebinning if necessary, otherwise interpolates.
+
         Parameters
         ----------
         wl : Quantity
@@ -332,19 +529,27 @@ class SpectralQty:
 
         if not wl.unit.is_equivalent(self.wl.unit):
             logger.error("Mismatching units for rebinning: " + wl.unit + ", " + self.wl.unit)
-        if (wl.value.size == 1 and (wl < min(self.wl) or wl > max(self.wl))) or (
-                wl.value.size > 1 and (min(wl) < min(self.wl) or max(wl) > max(self.wl))):
+        # Work on the plain values in order to avoid the overhead of astropy's unit handling
+        wl_new = wl.to_value(self.wl.unit)
+        wl_old = self.wl.value
+        wl_min, wl_max = wl_old.min(), wl_old.max()
+        if np.any(wl_new < wl_min) or np.any(wl_new > wl_max):
             if isinstance(self._fill_value, bool):
                 if not self._fill_value:
                     logger.warning("Extrapolation disabled, bandwidth will be reduced.")
                     # Remove new wavelengths where extrapolation would have been necessary
-                    wl = [x.value for x in wl if min(self.wl) <= x <= max(self.wl)] * wl.unit
-                f = interp1d(self.wl, self.qty.value, fill_value="extrapolate")
+                    mask = (wl_new >= wl_min) & (wl_new <= wl_max)
+                    wl = wl[mask]
+                    wl_new = wl_new[mask]
+                f = interp1d(wl_old, self.qty.value, fill_value="extrapolate")
             else:
-                f = interp1d(self.wl, self.qty.value, fill_value=self._fill_value, bounds_error=False)
+                f = interp1d(wl_old, self.qty.value, fill_value=self._fill_value, bounds_error=False)
+        elif np.all(np.diff(wl_old) > 0):
+            # Linear interpolation on a sorted grid doesn't need an interpolation object
+            return SpectralQty(wl, np.interp(wl_new, wl_old, self.qty.value) * self.qty.unit)
         else:
-            f = interp1d(self.wl, self.qty.value)
-        return SpectralQty(wl, f(wl.to(self.wl.unit)) * self.qty.unit)
+            f = interp1d(wl_old, self.qty.value)
+        return SpectralQty(wl, f(wl_new) * self.qty.unit)
 
     def integrate(self) -> u.Quantity:
         """
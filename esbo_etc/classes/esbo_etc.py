@@ -1,6 +1,5 @@
 import esbo_etc as eetc
 from esbo_etc.lib.logger import logger
-from esbo_etc.lib.cache import cache
 import logging as log
 import astropy.units as u
 
@@ -59,12 +58,12 @@ class esbo_etc:
 
         # Calculate results
         res = None
-        if hasattr(self.conf.common, "exposure_time") and hasattr(self.conf.common, "snr"):
+        keys = self.conf.common._keys
+        if {"exposure_time", "snr"} <= keys:
             res = detector.getSensitivity(self.conf.common.exposure_time(), self.conf.common.snr(),
                                           self.conf.astroscene.target.mag)
-        elif hasattr(self.conf.common, "exposure_time"):
+        elif "exposure_time" in keys:
             res = detector.getSNR(self.conf.common.exposure_time())
-        elif hasattr(self.conf.common, "snr"):
+        elif "snr" in keys:
             res = detector.getExpTime(self.conf.common.snr())
-        cache.close()
         return res
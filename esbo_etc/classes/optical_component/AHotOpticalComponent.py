@@ -3,17 +3,22 @@ from esbo_etc.classes.IRadiant import IRadiant
 from esbo_etc.classes.SpectralQty import SpectralQty
 from abc import abstractmethod
 import astropy.units as u
-from astropy.modeling.models import BlackBody
 from typing import Union, Callable
 from ..Entry import Entry
+from ...lib.helpers import greyBody
+from functools import cached_property
 
 
 class AHotOpticalComponent(AOpticalComponent):
     """
     Abstract super class for an optical component with thermal emission
     """
+    # defining the checks of the thermal parameters as (name, kind, arguments, optional)
+    CHECKS = [("emissivity", "file_or_float", (), True), ("temp", "quantity", (u.K,), True),
+              ("obstruction", "float", (), True), ("obstructor_temp", "quantity", (u.K,), True),
+              ("obstructor_emissivity", "float", (), True)]
+
     @abstractmethod
-    @u.quantity_input(wl_bins='length', temp=[u.Kelvin, u.Celsius], obstruction_temp=[u.Kelvin, u.Celsius])
     def __init__(self, parent: IRadiant, emissivity: Union[SpectralQty, int, float, str], temp: u.Quantity,
                  obstruction: float = 0, obstructor_temp: u.Quantity = 0 * u.K, obstructor_emissivity: float = 1):
         """
@@ -37,28 +42,43 @@ class AHotOpticalComponent(AOpticalComponent):
         obstructor_emissivity : float
             Emissivity of the obstructing component.
         """
+        # Check the unit directly instead of using the costly signature inspection of u.quantity_input
+        if not (isinstance(temp, u.Quantity) and temp.unit.is_equivalent(u.K, equivalencies=u.temperature())):
+            raise u.UnitsError("Argument 'temp' to function '__init__' must be a temperature.")
         # Initialize super class
         super().__init__(parent, obstruction=obstruction, obstructor_temp=obstructor_temp,
                          obstructor_emissivity=obstructor_emissivity)
-        if temp > 0 * u.K:
+        # The thermal emission is evaluated lazily on the first request of the component's noise
+        self.__emissivity = emissivity
+        self.__temp = temp
+
+    @cached_property
+    def _noise(self) -> Union[SpectralQty, Callable[[u.Quantity], u.Quantity], int, float]:
+        """
+        The thermal emission of the optical component, evaluated on first access.
+
+        Returns
+        -------
+        noise : Union[SpectralQty, Callable[[u.Quantity], u.Quantity], int, float]
+            The noise created by the optical component
+        """
+        if self.__temp > 0 * u.K:
             # Create noise from black body model
-            if isinstance(emissivity, SpectralQty):
-                bb = self.__gb_factory(temp)
-                self.__noise = SpectralQty(emissivity.wl, bb(emissivity.wl)) * emissivity
-            elif isinstance(emissivity, str):
+            if isinstance(self.__emissivity, SpectralQty):
+                bb = self.__gb_factory(self.__temp)
+                return SpectralQty(self.__emissivity.wl, bb(self.__emissivity.wl)) * self.__emissivity
+            elif isinstance(self.__emissivity, str):
                 try:
-                    em = float(emissivity)
-                    bb = self.__gb_factory(temp, em)
-                    self.__noise = bb
+                    em = float(self.__emissivity)
+                    return self.__gb_factory(self.__temp, em)
                 except ValueError:
-                    em = SpectralQty.fromFile(emissivity, u.nm, u.dimensionless_unscaled)
-                    bb = self.__gb_factory(temp)
-                    self.__noise = SpectralQty(em.wl, bb(em.wl)) * em
+                    em = SpectralQty.fromFile(self.__emissivity, u.nm, u.dimensionless_unscaled)
+                    bb = self.__gb_factory(self.__temp)
+                    return SpectralQty(em.wl, bb(em.wl)) * em
             else:
-                bb = self.__gb_factory(temp, emissivity)
-                self.__noise = bb
+                return self.__gb_factory(self.__temp, self.__emissivity)
         else:
-            self.__noise = 0
+            return 0
 
     def _ownNoise(self) -> Union[SpectralQty, Callable[[u.Quantity], u.Quantity], int, float]:
         """
@@ -69,7 +89,7 @@ class AHotOpticalComponent(AOpticalComponent):
         noise : Union[SpectralQty, Callable[[u.Quantity], u.Quantity], int, float]
             The noise created by the optical component
         """
-        return self.__noise
+        return self._noise
 
     @staticmethod
     @u.quantity_input(temp=[u.Kelvin, u.Celsius])
@@ -89,8 +109,7 @@ class AHotOpticalComponent(AOpticalComponent):
         bb : Callable
             The lambda function for the grey body.
         """
-        bb = BlackBody(temperature=temp, scale=em * u.W / (u.m ** 2 * u.nm * u.sr))
-        return lambda wl: bb(wl)
+        return greyBody(temp.to(u.K, equivalencies=u.temperature()).value, em)
 
     @staticmethod
     @abstractmethod
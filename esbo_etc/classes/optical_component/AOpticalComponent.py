@@ -3,9 +3,10 @@ from ..SpectralQty import SpectralQty
 from ...lib.logger import logger
 from abc import abstractmethod
 import astropy.units as u
-from astropy.modeling.models import BlackBody
-from typing import Union, Callable, Tuple
+from typing import Union, Callable, Tuple, List
 from ..Entry import Entry
+from ...lib.helpers import greyBody
+import logging as log
 import os
 
 
@@ -15,7 +16,6 @@ class AOpticalComponent(IRadiant):
     """
 
     @abstractmethod
-    @u.quantity_input(obstructor_temp=[u.K, u.Celsius])
     def __init__(self, parent: IRadiant, transreflectivity: Union[SpectralQty, int, float, u.Quantity] = None,
                  noise: Union[SpectralQty, int, float, u.Quantity, Callable] = None, obstruction: float = 0,
                  obstructor_temp: u.Quantity = 0 * u.K, obstructor_emissivity: float = 1):
@@ -43,14 +43,45 @@ class AOpticalComponent(IRadiant):
         obstructor_emissivity : float
             Emissivity of the obstructing component.
         """
+        # Check the unit directly instead of using the costly signature inspection of u.quantity_input
+        if not (isinstance(obstructor_temp, u.Quantity) and
+                obstructor_temp.unit.is_equivalent(u.K, equivalencies=u.temperature())):
+            raise u.UnitsError("Argument 'obstructor_temp' to function '__init__' must be a temperature.")
         self.__parent = parent
         if transreflectivity is not None:
             self.__transreflectivity = transreflectivity
         if noise is not None:
             self.__noise = noise
         self.__obstruction = obstruction
-        self.__obstructor_temp = obstructor_temp
-        self.__obstructor_emissivity = obstructor_emissivity
+        # The signal and the background are only calculated once on request
+        self.__signal = None
+        self.__background = None
+        # The transmitted fraction is constant for the component and therefore only calculated once
+        self.__unobstructed = 1. - obstruction
+        obstructor_temp = obstructor_temp.to(u.K, equivalencies=u.temperature()).value
+        # Bind the obstructor's grey body once, as temperature and emissivity are fixed for the component
+        if obstruction != 0 and obstructor_temp > 0 and obstructor_emissivity != 0:
+            self.__obstructor = greyBody(obstructor_temp, obstructor_emissivity)
+        else:
+            self.__obstructor = None
+
+    def chain(self) -> List[IRadiant]:
+        """
+        Collect the components of the beam up to and including this component
+
+        Returns
+        -------
+        chain : List[IRadiant]
+            The components of the beam ordered from the source to this component
+        """
+        chain = []
+        component = self
+        # Walk up the beam iteratively in order to avoid a recursion over the whole chain
+        while isinstance(component, AOpticalComponent):
+            chain.append(component)
+            component = component.__parent
+        chain.append(component)
+        return chain[::-1]
 
     def calcSignal(self) -> Tuple[SpectralQty, float]:
         """
@@ -63,12 +94,24 @@ class AOpticalComponent(IRadiant):
         obstruction : float
             The obstruction factor as A_ob / A_ap.
         """
-        signal, obstruction = self.__parent.calcSignal()
-        logger.info("Calculating signal for class '" + self.__class__.__name__ + "'.")
-        signal = self._propagate(signal) * (1 - self.__obstruction)
-        obstruction = obstruction + self.__obstruction
-        logger.debug(os.linesep + str(signal))
-        return signal, obstruction
+        if self.__signal is not None:
+            return self.__signal
+        chain = self.chain()
+        signal, obstruction = chain[0].calcSignal()
+        # Copy the signal of the source once, as the following components propagate it in place
+        signal = signal.copy()
+        unobstructed = 1.
+        for component in chain[1:]:
+            signal = component._stepSignal(signal)
+            obstruction = obstruction + component.__obstruction
+            unobstructed *= component.__unobstructed
+        # Apply the obstructions of all components within a single multiplication
+        if unobstructed != 1.:
+            signal = signal.imul(unobstructed)
+        # The signal is kept for subsequent calls and therefore must not be modified anymore
+        signal.qty.flags.writeable = False
+        self.__signal = (signal, obstruction)
+        return self.__signal
 
     def calcBackground(self) -> SpectralQty:
         """
@@ -79,17 +122,70 @@ class AOpticalComponent(IRadiant):
         background : SpectralQty
             The spectral radiance of the background
         """
-        parent = self.__parent.calcBackground()
+        if self.__background is not None:
+            return self.__background
+        chain = self.chain()
+        background = chain[0].calcBackground()
+        # Copy the background of the source once, as the following components propagate it in place
+        background = background.copy()
+        for component in chain[1:]:
+            background = component._stepBackground(background)
+        # The background is kept for subsequent calls and therefore must not be modified anymore
+        background.qty.flags.writeable = False
+        self.__background = background
+        return background
+
+    def _stepSignal(self, signal: SpectralQty) -> SpectralQty:
+        """
+        Propagate the signal of the parent element through this optical component, excluding the component's
+        obstruction
+
+        Parameters
+        ----------
+        signal : SpectralQty
+            The spectral flux density of the parent's signal
+
+        Returns
+        -------
+        signal : SpectralQty
+            The spectral flux density of the target's signal
+        """
+        logger.info("Calculating signal for class '" + self.__class__.__name__ + "'.")
+        signal = self._propagate(signal)
+        # Formatting the spectral quantity is expensive and therefore only done if it is going to be logged
+        if logger.isEnabledFor(log.DEBUG):
+            logger.debug(os.linesep + str(signal))
+        return signal
+
+    def _stepBackground(self, parent: SpectralQty) -> SpectralQty:
+        """
+        Propagate the background of the parent element through this optical component and add the component's noise
+
+        Parameters
+        ----------
+        parent : SpectralQty
+            The spectral radiance of the parent's background
+
+        Returns
+        -------
+        background : SpectralQty
+            The spectral radiance of the background
+        """
         logger.info("Calculating background for class '" + self.__class__.__name__ + "'.")
-        parent = self._propagate(parent)
-        if self.__obstructor_temp > 0 * u.K:
-            bb = BlackBody(temperature=self.__obstructor_temp, scale=1. * u.W / (u.m ** 2 * u.nm * u.sr))
-            obstructor = bb(parent.wl) * self.__obstructor_emissivity
-            background = parent * (1. - self.__obstruction) + obstructor * self.__obstruction
-        else:
-            background = parent * (1. - self.__obstruction)
-        background = background + self._ownNoise()
-        logger.debug(os.linesep + str(background))
+        background = self._propagate(parent)
+        # Unobstructed components neither attenuate the background nor add any emission of an obstructor
+        if self.__obstruction != 0:
+            # Attenuate the propagated background in place if its buffer is writable
+            background = background.imul(self.__unobstructed)
+            if self.__obstructor is not None:
+                # Add the obstructor's emission within the same buffer
+                obstructor = self.__obstructor(background.wl).to_value(background.qty.unit)
+                background = background.iadd((obstructor * self.__obstruction) << background.qty.unit)
+        # Add the component's own emission within the same buffer
+        background = background.iadd(self._ownNoise())
+        # Formatting the spectral quantity is expensive and therefore only done if it is going to be logged
+        if logger.isEnabledFor(log.DEBUG):
+            logger.debug(os.linesep + str(background))
         return background
 
     def _propagate(self, rad: SpectralQty) -> SpectralQty:
@@ -99,7 +195,7 @@ class AOpticalComponent(IRadiant):
         Parameters
         ----------
         rad : SpectralQty
-            The incoming radiation
+            The incoming radiation. It is owned by the propagation and may therefore be modified in place.
 
         Returns
         -------
@@ -107,7 +203,7 @@ class AOpticalComponent(IRadiant):
             Manipulated incoming radiation
         """
         try:
-            return rad * self.__transreflectivity
+            return rad.imul(self.__transreflectivity)
         except AttributeError:
             logger.error("Transreflectivity not given. Method propagate() needs to be implemented.")
 
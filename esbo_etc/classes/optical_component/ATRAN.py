@@ -6,12 +6,13 @@ from ...lib.logger import logger
 from ...lib.cache import cache
 import astropy.units as u
 from astropy.io import ascii
-from astropy.modeling.models import BlackBody
-from astropy.table import QTable
-from typing import Union
+from typing import Union, Tuple
 import re
+import io
+import os
 import requests as req
 import numpy as np
+from functools import lru_cache
 
 
 class ATRAN(Atmosphere):
@@ -21,9 +22,21 @@ class ATRAN(Atmosphere):
 
     # defining the ATRAN-endpoint
     ATRAN = "https://atran.arc.nasa.gov"
+    # share one session between all requests in order to reuse the connection to ATRAN
+    SESSION = req.Session()
+    SESSION.mount("https://", req.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    # defining the options provided by ATRAN
+    LATITUDES = np.array([9, 30, 39, 43, 59])
+    N_LAYERS = np.array([2, 3, 4, 5])
+    # defining the patterns to parse the ATRAN reply
+    ERROR_PATTERN = re.compile('<CENTER><H2>ERROR!!</H2></CENTER><CENTER>(.*)</CENTER>')
+    LINK_PATTERN = re.compile('href="(/atran_calc/atran.(?:plt|smo).\\d*.dat)"')
+    # defining the checks of the ATRAN parameters as (name, kind, arguments, optional)
+    CHECKS = [("altitude", "quantity", (u.imperial.ft,), False), ("wl_min", "quantity", (u.um,), False),
+              ("wl_max", "quantity", (u.um,), False), ("latitude", "quantity", (u.degree,), True),
+              ("water_vapor", "quantity", (u.um,), True), ("n_layers", "float", (), True),
+              ("zenith_angle", "quantity", (u.degree,), True), ("resolution", "float", (), True)]
 
-    @u.quantity_input(altitude="length", latitude="angle", water_vapor="length", zenith_angle="angle", wl_min="length",
-                      wl_max="length", temp=[u.Kelvin, u.Celsius])
     def __init__(self, parent: IRadiant, transmittance: str = None, altitude: u.Quantity = None,
                  wl_min: u.Quantity = None, wl_max: u.Quantity = None, latitude: u.Quantity = 39 * u.degree,
                  water_vapor: u.Quantity = 0 * u.um, n_layers: int = 2, zenith_angle: u.Quantity = 0 * u.degree,
@@ -56,23 +69,30 @@ class ATRAN(Atmosphere):
         temp : u.Quantity
             The atmospheric temperature for the atmosphere's black body radiation.
         """
+        # Check the units once directly instead of using the costly signature inspection of u.quantity_input
+        for name, value, unit in [("altitude", altitude, u.m), ("wl_min", wl_min, u.m), ("wl_max", wl_max, u.m),
+                                  ("latitude", latitude, u.degree), ("water_vapor", water_vapor, u.m),
+                                  ("zenith_angle", zenith_angle, u.degree), ("temp", temp, u.K)]:
+            if value is not None and not (isinstance(value, u.Quantity) and
+                                          value.unit.is_equivalent(unit, equivalencies=u.temperature())):
+                raise u.UnitsError("Argument '" + name + "' to function '__init__' must be in units convertible to '" +
+                                   unit.to_string() + "'.")
 
         if transmittance is not None:
-            data = self.__parse_ATRAN(transmittance)
+            # The parsed file is shared as long as it isn't modified.
+            wl, transmittance = self.__read_ATRAN(os.path.abspath(transmittance), os.stat(transmittance).st_mtime_ns)
         else:
             logger.info("Requesting ATRAN transmission profile.")
-            data = self.__call_ATRAN(altitude, wl_min, wl_max, latitude, water_vapor, n_layers, zenith_angle,
-                                     resolution)
+            wl, transmittance = self.__call_ATRAN(altitude, wl_min, wl_max, latitude, water_vapor, n_layers,
+                                                  zenith_angle, resolution)
 
-        transmittance = SpectralQty(data["col2"].quantity, data["col3"].quantity)
+        transmittance = SpectralQty(wl << u.um, transmittance << u.dimensionless_unscaled)
         super().__init__(parent, transmittance, temp=temp)
 
-    @u.quantity_input(altitude="length", latitude="angle", water_vapor="length", zenith_angle="angle", wl_min="length",
-                      wl_max="length")
     @cache
     def __call_ATRAN(self, altitude: u.Quantity, wl_min: u.Quantity, wl_max: u.Quantity,
                      latitude: u.Quantity = 39 * u.degree, water_vapor: u.Quantity = 0 * u.um, n_layers: int = 2,
-                     zenith_angle: u.Quantity = 0 * u.degree, resolution: int = 0):
+                     zenith_angle: u.Quantity = 0 * u.degree, resolution: int = 0) -> Tuple[np.ndarray, np.ndarray]:
         """
         Call the online version of ATRAN provided by SOFIA
 
@@ -97,24 +117,26 @@ class ATRAN(Atmosphere):
 
         Returns
         -------
-        data : QTable
-            The ATRAN computation results
+        wl : ndarray
+            The wavelengths of the ATRAN computation results in micrometer.
+        transmittance : ndarray
+            The transmittance of the ATRAN computation results.
         """
         # Select closest latitude from ATRAN options
-        latitude_ = min(np.array([9, 30, 39, 43, 59]) * u.degree, key=lambda x: abs(x - latitude.to(u.degree)))
+        latitude_ = self.LATITUDES[np.argmin(np.abs(self.LATITUDES - latitude.to(u.degree).value))]
         # Select closest number of layers from ATRAN options
-        n_layers_ = min([2, 3, 4, 5], key=lambda x: abs(x - n_layers))
+        n_layers_ = self.N_LAYERS[np.argmin(np.abs(self.N_LAYERS - n_layers))]
         # Assemble the data payload
         data = {'Altitude': altitude.to(u.imperial.ft).value,
-                'Obslat': '%d deg' % latitude_.value,
+                'Obslat': '%d deg' % latitude_,
                 'WVapor': water_vapor.to(u.um).value,
-                'NLayers': n_layers_,
+                'NLayers': int(n_layers_),
                 'ZenithAngle': zenith_angle.to(u.degree).value,
                 'WaveMin': wl_min.to(u.um).value,
                 'WaveMax': wl_max.to(u.um).value,
                 'Resolution': resolution}
         # Send data to ATRAN via POST request
-        res = req.post(url=self.ATRAN + "/cgi-bin/atran/atran.cgi", data=data)
+        res = self.SESSION.post(url=self.ATRAN + "/cgi-bin/atran/atran.cgi", data=data)
         # Check if request was successful
         if not res.ok:
             logger.error("Error: Request returned status code " + str(res.status_code))
@@ -122,71 +144,84 @@ class ATRAN(Atmosphere):
         # Extract the content of the reply
         content = res.text
         # Check if any ATRAN error occured
-        match = re.search('<CENTER><H2>ERROR!!</H2></CENTER><CENTER>(.*)</CENTER>', content)
+        match = self.ERROR_PATTERN.search(content)
         if match:
             logger.error("Error: " + match.group(1))
 
         # Extract link to ATRAN result file
-        match = re.search('href="(/atran_calc/atran.(?:plt|smo).\\d*.dat)"', content)
+        match = self.LINK_PATTERN.search(content)
         # Check if link was found
         if not match:
             logger.error("Error: Link to data file not found.")
 
-        # Request the ATRAN result via GET request
-        res = req.get(self.ATRAN + match.group(1))
-        # Check if request was successful
-        if not res.ok:
-            logger.error("Error: Request returned status code " + str(res.status_code))
-
-        # Extract the content of the reply
-        data = res.text
+        # Request the ATRAN result via GET request and parse the reply while it is downloaded
+        with self.SESSION.get(self.ATRAN + match.group(1), stream=True) as res:
+            # Check if request was successful
+            if not res.ok:
+                logger.error("Error: Request returned status code " + str(res.status_code))
+            res.raw.decode_content = True
+            wl, transmittance = self.__parse_ATRAN(io.TextIOWrapper(res.raw, encoding=res.encoding or "utf-8"))
         # Check if result is empty
-        if data == "":
+        if len(wl) == 0:
             logger.error("Error: Request returned empty response.")
-        return self.__parse_ATRAN(data)
+        return wl, transmittance
 
     @staticmethod
-    def __parse_ATRAN(table: str):
+    @lru_cache(maxsize=8)
+    def __read_ATRAN(file: str, mtime: int) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Parse an ATRAN result file and convert it to an astropy table
+        Read an ATRAN result file. As the results are cached, they are returned as read-only arrays.
 
         Parameters
         ----------
-        table : str
-            Path to the file or content of the file.
+        file : str
+            Absolute path to the ATRAN result file.
+        mtime : int
+            Modification time of the file in ns, used to invalidate the cache.
 
         Returns
         -------
-        data : astropy.Table
-            The parsed table object.
+        wl : ndarray
+            The parsed wavelengths in micrometer.
+        transmittance : ndarray
+            The parsed transmittance.
         """
-        # Read the file
-        data = ascii.read(table, format=None)
-        # Set units
-        data["col2"].unit = u.um
-        data["col3"].unit = u.dimensionless_unscaled
-        return data
+        wl, transmittance = ATRAN.__parse_ATRAN(file)
+        wl.flags.writeable = False
+        transmittance.flags.writeable = False
+        return wl, transmittance
 
     @staticmethod
-    @u.quantity_input(temp=[u.Kelvin, u.Celsius])
-    def __gb_factory(temp: u.Quantity, em: Union[int, float] = 1):
+    def __parse_ATRAN(table: Union[str, io.TextIOBase]) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Factory for a grey body lambda-function.
+        Parse an ATRAN result file and extract the wavelengths and the transmittance
 
         Parameters
         ----------
-        temp : Quantity in Kelvin / Celsius
-            The temperature fo the grey body.
-        em : Union[int, float]
-            Emissivity of the the grey body
+        table : Union[str, io.TextIOBase]
+            Path to the file, content of the file or a stream providing the content of the file.
 
         Returns
         -------
-        bb : Callable
-            The lambda function for the grey body.
+        wl : ndarray
+            The parsed wavelengths in micrometer.
+        transmittance : ndarray
+            The parsed transmittance.
         """
-        bb = BlackBody(temperature=temp, scale=em * u.W / (u.m ** 2 * u.nm * u.sr))
-        return lambda wl: bb(wl)
+        # Read the two-column layout of ATRAN directly, as the format guessing of astropy is slow
+        if isinstance(table, str) and "\n" in table:
+            source = io.StringIO(table)
+        else:
+            source = table
+        try:
+            values = np.loadtxt(source, usecols=(1, 2), ndmin=2)
+            return values[:, 0], values[:, 1]
+        except (ValueError, IndexError):
+            # Streams can't be read again
+            if not isinstance(table, str):
+                logger.error("Error: Unable to parse the ATRAN result.")
+            data = ascii.read(table, format=None)
+            return np.asarray(data["col2"], dtype=np.float64), np.asarray(data["col3"], dtype=np.float64)
 
     def __repr__(self):
         return "ATRAN Object"
@@ -206,41 +241,8 @@ class ATRAN(Atmosphere):
         mes : Union[None, str]
             The error message of the check. This will be None if the check was successful.
         """
-        if hasattr(conf, "transmittance"):
-            mes = conf.check_file("transmittance")
-            if mes is not None:
-                return mes
-        else:
-            mes = conf.check_quantity("altitude", u.imperial.ft)
-            if mes is not None:
-                return mes
-            mes = conf.check_quantity("wl_min", u.um)
-            if mes is not None:
-                return mes
-            mes = conf.check_quantity("wl_max", u.um)
-            if mes is not None:
-                return mes
-            if hasattr(conf, "latitude"):
-                mes = conf.check_quantity("latitude", u.degree)
-                if mes is not None:
-                    return mes
-            if hasattr(conf, "water_vapor"):
-                mes = conf.check_quantity("water_vapor", u.um)
-                if mes is not None:
-                    return mes
-            if hasattr(conf, "n_layers"):
-                mes = conf.check_float("n_layers")
-                if mes is not None:
-                    return mes
-            if hasattr(conf, "zenith_angle"):
-                mes = conf.check_quantity("zenith_angle", u.degree)
-                if mes is not None:
-                    return mes
-            if hasattr(conf, "resolution"):
-                mes = conf.check_float("resolution")
-                if mes is not None:
-                    return mes
-        if hasattr(conf, "temp"):
-            mes = conf.check_quantity("temp", u.K)
-            if mes is not None:
-                return mes
+        # Either the ATRAN output is given as file or the parameters for requesting it
+        mes = conf.check_file("transmittance") if hasattr(conf, "transmittance") else conf.check_all(ATRAN.CHECKS)
+        if mes is not None:
+            return mes
+        return conf.check_all(Atmosphere.TEMP_CHECKS)
@@ -3,14 +3,20 @@ from ..IRadiant import IRadiant
 from ..SpectralQty import SpectralQty
 from ..Entry import Entry
 import astropy.units as u
-from astropy.modeling.models import BlackBody
+import numpy as np
+from ...lib.helpers import greyBody
 from typing import Union
+from concurrent.futures import ThreadPoolExecutor
 
 
 class Atmosphere(AOpticalComponent):
     """
     A class to model the atmosphere including the atmosphere's spectral transmittance and emission.
     """
+    # defining the checks of the parameters as (name, kind, arguments, optional)
+    CHECKS = [("transmittance", "file", (), False), ("emission", "file", (), True)]
+    # defining the check of the temperature shared with the subclasses
+    TEMP_CHECKS = [("temp", "quantity", (u.K,), True)]
 
     @u.quantity_input(temp=[u.Kelvin, u.Celsius])
     def __init__(self, parent: IRadiant, transmittance: Union[str, float, SpectralQty], emission: str = None,
@@ -32,24 +38,34 @@ class Atmosphere(AOpticalComponent):
             The atmospheric temperature for the atmosphere's black body radiation.
         """
 
-        # Read the transmittance
-        if isinstance(transmittance, str):
-            transmittance_sqty = SpectralQty.fromFile(transmittance, wl_unit_default=u.nm,
-                                                      qty_unit_default=u.dimensionless_unscaled)
+        if isinstance(transmittance, str) and emission:
+            # Read the independent transmittance and emission files concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                transmittance_future = executor.submit(SpectralQty.fromFile, transmittance, wl_unit_default=u.nm,
+                                                       qty_unit_default=u.dimensionless_unscaled)
+                emission_future = executor.submit(SpectralQty.fromFile, emission, wl_unit_default=u.nm,
+                                                  qty_unit_default=u.W / (u.m ** 2 * u.nm * u.sr))
+                transmittance_sqty, emission_sqty = transmittance_future.result(), emission_future.result()
         else:
-            transmittance_sqty = transmittance
-        if emission:
-            # Read the emission
-            emission_sqty = SpectralQty.fromFile(emission, wl_unit_default=u.nm,
-                                                 qty_unit_default=u.W / (u.m ** 2 * u.nm * u.sr))
-        elif temp is not None:
-            # Create black body
-            bb = self.__gb_factory(temp)
-            # Calculate emission
-            emission_sqty = SpectralQty(transmittance_sqty.wl, bb(transmittance_sqty.wl)) * (
-                        -1 * transmittance_sqty + 1)
-        else:
-            emission_sqty = 0
+            # Read the transmittance
+            if isinstance(transmittance, str):
+                transmittance_sqty = SpectralQty.fromFile(transmittance, wl_unit_default=u.nm,
+                                                          qty_unit_default=u.dimensionless_unscaled)
+            else:
+                transmittance_sqty = transmittance
+            if emission:
+                # Read the emission
+                emission_sqty = SpectralQty.fromFile(emission, wl_unit_default=u.nm,
+                                                     qty_unit_default=u.W / (u.m ** 2 * u.nm * u.sr))
+            elif temp is not None:
+                # Create black body
+                bb = self.__gb_factory(temp)(transmittance_sqty.wl)
+                # Calculate emission as bb * (1 - transmittance) within a single buffer on the plain values
+                emission = np.subtract(1., transmittance_sqty.qty.to_value(u.dimensionless_unscaled))
+                np.multiply(emission, bb.value, out=emission)
+                emission_sqty = SpectralQty(transmittance_sqty.wl, emission << bb.unit)
+            else:
+                emission_sqty = 0
 
         super().__init__(parent=parent, transreflectivity=transmittance_sqty, noise=emission_sqty)
 
@@ -71,8 +87,7 @@ class Atmosphere(AOpticalComponent):
         bb : Callable
             The lambda function for the grey body.
         """
-        bb = BlackBody(temperature=temp, scale=em * u.W / (u.m ** 2 * u.nm * u.sr))
-        return lambda wl: bb(wl)
+        return greyBody(temp.to(u.K, equivalencies=u.temperature()).value, em)
 
     @staticmethod
     def check_config(conf: Entry) -> Union[None, str]:
@@ -89,14 +104,8 @@ class Atmosphere(AOpticalComponent):
         mes : Union[None, str]
             The error message of the check. This will be None if the check was successful.
         """
-        mes = conf.check_file("transmittance")
-        if mes is not None:
+        mes = conf.check_all(Atmosphere.CHECKS)
+        # The temperature is only used if no emission is given
+        if mes is not None or hasattr(conf, "emission"):
             return mes
-        if hasattr(conf, "emission"):
-            mes = conf.check_file("emission")
-            if mes is not None:
-                return mes
-        elif hasattr(conf, "temp"):
-            mes = conf.check_quantity("temp", u.K)
-            if mes is not None:
-                return mes
+        return conf.check_all(Atmosphere.TEMP_CHECKS)
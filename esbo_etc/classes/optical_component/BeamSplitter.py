@@ -10,7 +10,9 @@ class BeamSplitter(AHotOpticalComponent):
     """
     A class to model the optical characteristics of a beam splitter.
     """
-    @u.quantity_input(temp=[u.Kelvin, u.Celsius], obstructor_temp=[u.Kelvin, u.Celsius])
+    # defining the checks of the parameters as (name, kind, arguments, optional)
+    CHECKS = [("transmittance", "file_or_float", (), False)] + AHotOpticalComponent.CHECKS
+
     def __init__(self, parent: IRadiant, transmittance: str, emissivity: Union[str, float] = None,
                  temp: u.Quantity = 0 * u.K, obstruction: float = 0, obstructor_temp: u.Quantity = 0 * u.K,
                  obstructor_emissivity: float = 1):
@@ -42,7 +44,7 @@ class BeamSplitter(AHotOpticalComponent):
         except ValueError:
             self._transmittance = SpectralQty.fromFile(transmittance, u.nm, u.dimensionless_unscaled)
         if emissivity is None:
-            emissivity = -1 * self._transmittance + 1.0
+            emissivity = 1.0 - self._transmittance
         super().__init__(parent, emissivity, temp, obstruction, obstructor_temp, obstructor_emissivity)
 
     def _propagate(self, rad: SpectralQty) -> SpectralQty:
@@ -59,7 +61,7 @@ class BeamSplitter(AHotOpticalComponent):
         rad : SpectralQty
             Manipulated incoming radiation
         """
-        return rad * self._transmittance
+        return rad.imul(self._transmittance)
 
     @staticmethod
     def check_config(conf: Entry) -> Union[None, str]:
@@ -76,30 +78,4 @@ class BeamSplitter(AHotOpticalComponent):
         mes : Union[None, str]
             The error message of the check. This will be None if the check was successful.
         """
-        mes = conf.check_file("transmittance")
-        if mes is not None:
-            mes = conf.check_float("transmittance")
-            if mes is not None:
-                return mes
-        if hasattr(conf, "emissivity"):
-            mes = conf.check_file("emissivity")
-            if mes is not None:
-                mes = conf.check_float("emissivity")
-                if mes is not None:
-                    return mes
-        if hasattr(conf, "temp"):
-            mes = conf.check_quantity("temp", u.K)
-            if mes is not None:
-                return mes
-        if hasattr(conf, "obstruction"):
-            mes = conf.check_float("obstruction")
-            if mes is not None:
-                return mes
-        if hasattr(conf, "obstructor_temp"):
-            mes = conf.check_quantity("obstructor_temp", u.K)
-            if mes is not None:
-                return mes
-        if hasattr(conf, "obstructor_emissivity"):
-            mes = conf.check_float("obstructor_emissivity")
-            if mes is not None:
-                return mes
+        return conf.check_all(BeamSplitter.CHECKS)
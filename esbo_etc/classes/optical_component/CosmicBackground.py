@@ -1,7 +1,7 @@
 from .AOpticalComponent import AOpticalComponent
 from ..IRadiant import IRadiant
 import astropy.units as u
-from astropy.modeling.models import BlackBody
+from ...lib.helpers import greyBody
 from ..Entry import Entry
 from typing import Union
 
@@ -10,6 +10,8 @@ class CosmicBackground(AOpticalComponent):
     """
     This class models the spectral radiance of the cosmic background as black body radiator
     """
+    # defining the checks of the parameters as (name, kind, arguments, optional)
+    CHECKS = [("temp", "quantity", (u.K,), False), ("emissivity", "float", (), True)]
 
     @u.quantity_input(temp=[u.Kelvin, u.Celsius])
     def __init__(self, parent: IRadiant, temp: u.Quantity = 2.725 * u.K, emissivity: float = 1):
@@ -28,10 +30,8 @@ class CosmicBackground(AOpticalComponent):
         Returns
         -------
         """
-        # Create black body model with given temperature
-        bb = BlackBody(temperature=temp, scale=1 * u.W / (u.m ** 2 * u.nm * u.sr))
-        # Initialize super class
-        super().__init__(parent, 1.0, lambda wl: bb(wl) * emissivity)
+        # Initialize super class with the grey body model of the given temperature
+        super().__init__(parent, 1.0, greyBody(temp.to(u.K, equivalencies=u.temperature()).value, emissivity))
 
     @staticmethod
     def check_config(conf: Entry) -> Union[None, str]:
@@ -48,10 +48,4 @@ class CosmicBackground(AOpticalComponent):
         mes : Union[None, str]
             The error message of the check. This will be None if the check was successful.
         """
-        mes = conf.check_quantity("temp", u.K)
-        if mes is not None:
-            return mes
-        if hasattr(conf, "emissivity"):
-            mes = conf.check_float("emissivity")
-            if mes is not None:
-                return mes
+        return conf.check_all(CosmicBackground.CHECKS)
@@ -6,6 +6,7 @@ from ..Entry import Entry
 from astropy import units as u
 from typing import Union
 import numpy as np
+from functools import lru_cache
 
 
 class Filter(AHotOpticalComponent):
@@ -20,6 +21,8 @@ class Filter(AHotOpticalComponent):
                  H=dict(cwl=1650 * u.nm, bw=400 * u.nm), K=dict(cwl=2200 * u.nm, bw=600 * u.nm),
                  L=dict(cwl=3600 * u.nm, bw=1200 * u.nm), M=dict(cwl=4800 * u.nm, bw=800 * u.nm),
                  N=dict(cwl=10200 * u.nm, bw=2500 * u.nm))
+    # The pass-bands of the bands as (start, end), derived once from the central wavelengths and bandwidths
+    _band_range = {band: (val["cwl"] - val["bw"] / 2, val["cwl"] + val["bw"] / 2) for band, val in _band.items()}
 
     def __init__(self, **kwargs):
         """
@@ -64,7 +67,6 @@ class Filter(AHotOpticalComponent):
         self._transmittance = args.pop("transmittance")
         super().__init__(**args)
 
-    # @u.quantity_input(temp=[u.Kelvin, u.Celsius], obstructor_temp=[u.Kelvin, u.Celsius])
     def _fromBand(self, parent: IRadiant, band: str, emissivity: Union[str, float] = 1, temp: u.Quantity = 0 * u.K,
                   obstruction: float = 0, obstructor_temp: u.Quantity = 0 * u.K,
                   obstructor_emissivity: float = 1) -> dict:
@@ -97,13 +99,12 @@ class Filter(AHotOpticalComponent):
         args : dict
             The arguments for the class instantiation.
         """
-        if band not in self._band.keys():
+        if band not in self._band_range:
             logger.error("Band has to be one of '[" + ", ".join(list(self._band.keys())) + "]'")
-        return self._fromRange(parent, self._band[band]["cwl"] - self._band[band]["bw"] / 2,
-                               self._band[band]["cwl"] + self._band[band]["bw"] / 2, emissivity, temp, obstruction,
-                               obstructor_temp, obstructor_emissivity)
+        start, end = self._band_range[band]
+        return self._fromRange(parent, start, end, emissivity, temp, obstruction, obstructor_temp,
+                               obstructor_emissivity)
 
-    # @u.quantity_input(temp=[u.Kelvin, u.Celsius], obstructor_temp=[u.Kelvin, u.Celsius])
     def _fromFile(self, parent: IRadiant, transmittance: str, emissivity: Union[str, float] = None,
                   temp: u.Quantity = 0 * u.K, obstruction: float = 0, obstructor_temp: u.Quantity = 0 * u.K,
                   obstructor_emissivity: float = 1) -> dict:
@@ -141,12 +142,11 @@ class Filter(AHotOpticalComponent):
         except ValueError:
             _transmittance = SpectralQty.fromFile(transmittance, u.nm, u.dimensionless_unscaled)
         if emissivity is None:
-            emissivity = -1 * _transmittance + 1.0
+            emissivity = 1.0 - _transmittance
         return {"parent": parent, "transmittance": _transmittance,
                 "emissivity": emissivity, "temp": temp, "obstruction": obstruction, "obstructor_temp": obstructor_temp,
                 "obstructor_emissivity": obstructor_emissivity}
 
-    # @u.quantity_input(start="length", end="length", temp=[u.Kelvin, u.Celsius], obstructor_temp=[u.Kelvin, u.Celsius])
     def _fromRange(self, parent: IRadiant, start: u.Quantity, end: u.Quantity, emissivity: Union[str, float] = 1,
                    temp: u.Quantity = 0 * u.K, obstruction: float = 0, obstructor_temp: u.Quantity = 0 * u.K,
                    obstructor_emissivity: float = 1) -> dict:
@@ -199,7 +199,7 @@ class Filter(AHotOpticalComponent):
         sqty : SpectralQty
             Manipulated incoming radiation
         """
-        return sqty * self._transmittance
+        return sqty.imul(self._transmittance)
 
     @staticmethod
     @u.quantity_input(start="length", end="length")
@@ -219,8 +219,38 @@ class Filter(AHotOpticalComponent):
         lambda : Callable[[u.Quantity], u.Quantity]
             The filter function
         """
-        return lambda wl: np.logical_and(np.greater_equal(wl, start), np.greater_equal(end, wl)).astype(
-            int) * u.dimensionless_unscaled
+        # Convert the limits once, so the filter function only compares plain values
+        start, end = start.to_value(u.nm), end.to_value(u.nm)
+        return lambda wl: Filter.__bandpass(start, end, wl.shape,
+                                            np.ascontiguousarray(wl.to_value(u.nm), dtype=np.float64).tobytes())
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def __bandpass(start: float, end: float, shape: tuple, wl: bytes) -> u.Quantity:
+        """
+        Evaluate an infinite order bandpass filter on a wavelength grid. The results are memoized, as filters of the
+        same band are usually evaluated repeatedly on the same wavelength grid.
+
+        Parameters
+        ----------
+        start : float
+            Start wavelength of the pass-band in nm.
+        end : float
+            End wavelength of the pass-band in nm.
+        shape : tuple
+            The shape of the wavelength grid.
+        wl : bytes
+            The raw float64 buffer of the wavelength grid in nm.
+
+        Returns
+        -------
+        transmittance : Quantity
+            The dimensionless transmittance of the filter. As it is shared between all callers, it is read-only.
+        """
+        wl = np.frombuffer(wl).reshape(shape)
+        transmittance = ((wl >= start) & (wl <= end)).astype(np.float64)
+        transmittance.flags.writeable = False
+        return transmittance << u.dimensionless_unscaled
 
     @staticmethod
     def check_config(conf: Entry) -> Union[None, str]:
@@ -240,9 +270,7 @@ class Filter(AHotOpticalComponent):
         if hasattr(conf, "band"):
             mes = conf.check_selection("band", ["U", "B", "V", "R", "I", "J", "H", "K", "L", "M", "N"])
         elif hasattr(conf, "transmittance"):
-            mes = conf.check_file("transmittance")
-            if mes is not None:
-                mes = conf.check_float("transmittance")
+            mes = conf.check_file_or_float("transmittance")
         elif hasattr(conf, "start") and hasattr(conf, "end"):
             mes = conf.check_quantity("start", u.m)
             if mes is not None:
@@ -252,25 +280,4 @@ class Filter(AHotOpticalComponent):
             mes = "Expected one of 'band' / 'transmittance' / 'start' & 'end'."
         if mes is not None:
             return mes
-        if hasattr(conf, "emissivity"):
-            mes = conf.check_file("emissivity")
-            if mes is not None:
-                mes = conf.check_float("emissivity")
-                if mes is not None:
-                    return mes
-        if hasattr(conf, "temp"):
-            mes = conf.check_quantity("temp", u.K)
-            if mes is not None:
-                return mes
-        if hasattr(conf, "obstruction"):
-            mes = conf.check_float("obstruction")
-            if mes is not None:
-                return mes
-        if hasattr(conf, "obstructor_temp"):
-            mes = conf.check_quantity("obstructor_temp", u.K)
-            if mes is not None:
-                return mes
-        if hasattr(conf, "obstructor_emissivity"):
-            mes = conf.check_float("obstructor_emissivity")
-            if mes is not None:
-                return mes
+        return conf.check_all(AHotOpticalComponent.CHECKS)
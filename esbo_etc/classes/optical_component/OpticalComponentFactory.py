@@ -40,8 +40,8 @@ class OpticalComponentFactory(ARadiantFactory):
         if parent is not None:
             opts = self.collectOptions(options)
             opts["parent"] = parent
-            if hasattr(oc, options.type):
-                class_ = getattr(oc, options.type)
+            class_ = getattr(oc, options.type, None)
+            if class_ is not None:
                 return class_(**opts)
             else:
                 logger.error("Unknown optical component type: '" + options.type + "'")
@@ -64,18 +64,12 @@ class OpticalComponentFactory(ARadiantFactory):
         parent : AOpticalComponent
             The decorated parent object.
         """
-        if hasattr(conf.astroscene, "optical_component"):
-            for entry in conf.astroscene.optical_component if type(conf.astroscene.optical_component) == list else\
-                    [conf.astroscene.optical_component]:
-                parent = self.create(entry, parent)
-        if hasattr(conf, "common_optics") and hasattr(conf.common_optics, "optical_component"):
-            for entry in conf.common_optics.optical_component if type(conf.common_optics.optical_component) == \
-                                                                 list else [conf.common_optics.optical_component]:
-                if isinstance(entry, Entry):
-                    parent = self.create(entry, parent)
-        if hasattr(conf, "instrument") and hasattr(conf.instrument, "optical_component"):
-            for entry in conf.instrument.optical_component if type(conf.instrument.optical_component) == list else\
-                    [conf.instrument.optical_component]:
+        # Chain the optical components of all sections in the order of the beam
+        for section in ["astroscene", "common_optics", "instrument"]:
+            entries = getattr(getattr(conf, section, None), "optical_component", None)
+            if entries is None:
+                continue
+            for entry in entries if isinstance(entries, list) else [entries]:
                 if isinstance(entry, Entry):
                     parent = self.create(entry, parent)
         return parent
@@ -1,5 +1,5 @@
 from .IPSF import IPSF
-from ...lib.helpers import rasterizeCircle
+from ...lib.helpers import encircledSum
 from ..sensor.PixelMask import PixelMask
 from ...lib.logger import logger
 from abc import abstractmethod
@@ -7,14 +7,16 @@ import numpy as np
 import astropy.units as u
 from typing import Union
 from scipy.optimize import bisect
-from scipy.signal import fftconvolve
-from scipy.interpolate import interp2d
+from scipy.signal import convolve
+from scipy.interpolate import RectBivariateSpline
 
 
 class AGriddedPSF(IPSF):
     """
     A class for modelling the PSF from a two dimensional grid
     """
+    # Floating point type used for the jitter convolution
+    _DTYPE = np.float32
 
     @abstractmethod
     @u.quantity_input(wl="length", d_aperture="length", pixel_size="length", grid_delta="length")
@@ -52,9 +54,8 @@ class AGriddedPSF(IPSF):
         self._grid_delta = grid_delta
         self._center_point = center_point
 
-        self._center_point_os = None
-        self._psf_os = None
-        self._psf_osf = None
+        # Oversampled and jittered PSFs, keyed by the jitter sigma in arcsec
+        self._psf_cache = {}
 
     # @u.quantity_input(jitter_sigma=u.arcsec)
     def calcReducedObservationAngle(self, contained_energy: Union[str, int, float, u.Quantity],
@@ -85,19 +86,17 @@ class AGriddedPSF(IPSF):
         elif type(contained_energy) in [int, float]:
             contained_energy = contained_energy / 100 * u.dimensionless_unscaled
 
-        center_point, psf, psf_osf = self._calcPSF(jitter_sigma)
+        center_point, psf, psf_osf, total = self._calcPSF(jitter_sigma)
 
         # Calculate the maximum possible radius for the circle containing the photometric aperture
         r_max = max(np.sqrt(center_point[0] ** 2 + center_point[1] ** 2),
                    np.sqrt((psf.shape[0] - center_point[0]) ** 2 + center_point[1] ** 2),
                    np.sqrt(center_point[0] ** 2 + (psf.shape[1] - center_point[1]) ** 2),
                    np.sqrt((psf.shape[0] - center_point[0]) ** 2 + (psf.shape[1] - center_point[1]) ** 2))
-        # Calculate the total contained energy of the PSF
-        total = np.sum(psf)
+        # Sort the PSF once by radius, so the contained energy of each radius is found by a binary search
+        contained = encircledSum(psf, center_point[0], center_point[1])
         # Iterate the optimal radius for the contained energy
-        r = bisect(lambda r_c: contained_energy.value - np.sum(
-            psf * rasterizeCircle(np.zeros((psf.shape[0], psf.shape[1])), r_c, center_point[0],
-                                  center_point[1])) / total, 0, r_max, xtol=1e-1)
+        r = bisect(lambda r_c: contained_energy.value - contained(r_c) / total, 0, r_max, xtol=1e-1)
         # Calculate the reduced observation angle in lambda / d_ap
         # noinspection PyTypeChecker
         reduced_observation_angle = r / psf_osf * self._grid_delta[0] / (
@@ -122,7 +121,12 @@ class AGriddedPSF(IPSF):
             The PSF.
         psf_osf : float
             The oversampling factor of the returned PSF.
+        psf_sum : float
+            The total contained energy of the returned PSF.
         """
+        key = None if jitter_sigma is None else float(jitter_sigma.to(u.arcsec).value)
+        if key in self._psf_cache:
+            return self._psf_cache[key]
         # Calculate the psf oversampling factor for the PSF based on the current resolution of the PSF
         psf_osf = np.ceil(max(self._grid_delta) / (self._pixel_size / self._osf)).value
         if psf_osf == 1.0:
@@ -131,45 +135,39 @@ class AGriddedPSF(IPSF):
             center_point = self._center_point
         else:
             # Oversampling is necessary, oversample the PSF and calculate the new center point.
-            f = interp2d(x=np.arange(self._psf.shape[1]) - self._center_point[1],
-                         y=np.arange(self._psf.shape[0]) - self._center_point[0], z=self._psf,
-                         kind='cubic', copy=False, bounds_error=False, fill_value=None)
+            f = RectBivariateSpline(x=np.arange(self._psf.shape[0]) - self._center_point[0],
+                                    y=np.arange(self._psf.shape[1]) - self._center_point[1], z=self._psf, kx=3, ky=3)
             center_point = [(x + 0.5) * psf_osf - 0.5 for x in self._center_point]
-            psf = f((np.arange(self._psf.shape[1] * psf_osf) - center_point[1]) / psf_osf,
-                    (np.arange(self._psf.shape[0] * psf_osf) - center_point[0]) / psf_osf)
+            psf = f((np.arange(self._psf.shape[0] * psf_osf) - center_point[0]) / psf_osf,
+                    (np.arange(self._psf.shape[1] * psf_osf) - center_point[1]) / psf_osf)
         if jitter_sigma is not None:
             # Convert angular jitter to jitter on focal plane
             jitter_sigma_um = (jitter_sigma.to(u.rad) * self._f_number * self._d_aperture / u.rad).to(u.um)
+            # Grid width of the oversampled PSF and jitter sigma in microns
+            dx = min(self._grid_delta.to(u.um).value) / psf_osf
+            sigma = jitter_sigma_um.value
             # Jitter is enabled. Calculate the corresponding gaussian bell and convolve it with the PSF
-            if min(self._grid_delta) / psf_osf < 6 * jitter_sigma_um:
+            if dx < 6 * sigma:
                 # 6-sigma interval of the gaussian bell is larger than the grid width
                 # Calculate the necessary grid length for the 6-sigma interval of the gaussian bell
-                jitter_grid_length = np.ceil(6 * jitter_sigma_um / (min(self._grid_delta) / psf_osf)).value
+                jitter_grid_length = np.ceil(6 * sigma / dx)
                 # Make sure, the grid size is odd in order to have a defined kernel center
                 jitter_grid_length = int(jitter_grid_length if jitter_grid_length % 2 == 1 else jitter_grid_length + 1)
 
-                # Create a meshgrid containing the x and y coordinates of each point within the first quadrant of the
-                # gaussian kernel
-                xv, yv = np.meshgrid(range(-int((jitter_grid_length - 1) / 2), 1),
-                                     range(-int((jitter_grid_length - 1) / 2), 1))
-                # Calculate the gaussian kernel in the first quadrant
-                kernel = 1 / (2 * np.pi * jitter_sigma_um.value ** 2) * np.exp(
-                    -((xv * min(self._grid_delta.value) / psf_osf) ** 2 +
-                      (yv * min(self._grid_delta.value) / psf_osf) ** 2) / (2 * jitter_sigma_um.value ** 2))
-                # Mirror the kernel from the first quadrant to all other quadrants
-                kernel = np.concatenate((kernel, np.flip(kernel, axis=1)[:, 1:]), axis=1)
-                kernel = np.concatenate((kernel, np.flip(kernel, axis=0)[1:, :]), axis=0)
-                # Normalize kernel
-                kernel = kernel / np.sum(kernel)
-                # Convolve PSF with gaussian kernel
-                psf = fftconvolve(psf, kernel, mode="full")
+                # The gaussian kernel is separable, therefore only the normalized one-dimensional gaussian bell needs
+                # to be evaluated
+                xv = np.arange(-int((jitter_grid_length - 1) / 2), int((jitter_grid_length - 1) / 2) + 1)
+                gauss = np.exp(-(xv * dx) ** 2 / (2 * sigma ** 2))
+                gauss = (gauss / np.sum(gauss)).astype(self._DTYPE)
+                # Convolve PSF with gaussian kernel as two one-dimensional convolutions along the axes. Scipy chooses
+                # between the direct and the FFT-based convolution depending on the sizes of the PSF and the kernel.
+                psf = convolve(convolve(psf.astype(self._DTYPE, copy=False), gauss.reshape(-1, 1), mode="full"),
+                               gauss.reshape(1, -1), mode="full").astype(np.float64)
                 # Calculate new center point
                 center_point = [x + int((jitter_grid_length - 1) / 2) for x in center_point]
-        # Save the values as object attribute
-        self._center_point_os = center_point
-        self._psf_os = psf
-        self._psf_osf = psf_osf
-        return center_point, psf, psf_osf
+        # Cache the values for subsequent calls with the same jitter
+        self._psf_cache[key] = center_point, psf, psf_osf, np.sum(psf)
+        return self._psf_cache[key]
 
     def mapToPixelMask(self, mask: PixelMask, jitter_sigma: u.Quantity = None, obstruction: float = 0.0) -> PixelMask:
         """
@@ -199,27 +197,22 @@ class AGriddedPSF(IPSF):
         # Calculate the new PSF-center indices of the reduced mask
         psf_center_ind = [(x + 0.5) * self._osf - 0.5 for x in psf_center_ind]
 
-        # Get PSF values or calculate them if not available
-        if self._psf_os is not None and self._center_point_os is not None and self._psf_osf is not None:
-            center_point = self._center_point_os
-            psf = self._psf_os
-            psf_osf = self._psf_osf
-        else:
-            center_point, psf, psf_osf = self._calcPSF(jitter_sigma)
+        # Get PSF values (cached if already calculated for this jitter)
+        center_point, psf, psf_osf, psf_sum = self._calcPSF(jitter_sigma)
         # Calculate the coordinates of each PSF value in microns
         x = (np.arange(psf.shape[1]) - center_point[1]) * self._grid_delta[1].to(u.um).value / psf_osf
         y = (np.arange(psf.shape[0]) - center_point[0]) * self._grid_delta[0].to(u.um).value / psf_osf
         # Initialize a two-dimensional cubic interpolation function for the PSF
-        psf_interp = interp2d(x=x, y=y, z=psf, kind='cubic', copy=False, bounds_error=False, fill_value=None)
+        psf_interp = RectBivariateSpline(x=y, y=x, z=psf, kx=3, ky=3)
         # Calculate the values of the PSF for all elements of the reduced mask
-        res = psf_interp((np.arange(mask_red_os.shape[1]) - psf_center_ind[1]) * mask_red_os.pixel_size.to(u.um).value,
-                         (np.arange(mask_red_os.shape[0]) - psf_center_ind[0]) * mask_red_os.pixel_size.to(u.um).value)
+        res = psf_interp((np.arange(mask_red_os.shape[0]) - psf_center_ind[0]) * mask_red_os.pixel_size.to(u.um).value,
+                         (np.arange(mask_red_os.shape[1]) - psf_center_ind[1]) * mask_red_os.pixel_size.to(u.um).value)
+        # Integrate the reduced mask and divide by the indefinite integral to get relative intensities
+        scale = mask_red_os.pixel_size.to(u.um).value ** 2 / (
+                psf_sum * (self._grid_delta[0].to(u.um).value / psf_osf) ** 2)
         # Bin the oversampled reduced mask to the original resolution and multiply with the reduced mask to select only
         # the relevant values
-        res = mask_red * self._rebin(res, 1 / self._osf)
-        # Integrate the reduced mask and divide by the indefinite integral to get relative intensities
-        res = res * mask_red_os.pixel_size.to(u.um).value ** 2 / (
-                psf.sum() * (self._grid_delta[0].to(u.um).value / psf_osf) ** 2)
+        res = mask_red * (self._rebin(res, 1 / self._osf) * scale)
         # reintegrate the reduced mask into the complete mask
         mask[y_ind.min():(y_ind.max() + 1), x_ind.min():(x_ind.max() + 1)] = res
         return mask
@@ -40,8 +40,8 @@ class SensorFactory(AFactory):
         if parent is not None:
             opts = self.collectOptions(options)
             args = dict(parent=parent, **opts, common_conf=self._common_conf)
-            if hasattr(sensor, options.type):
-                class_ = getattr(sensor, options.type)
+            class_ = getattr(sensor, options.type, None)
+            if class_ is not None:
                 return class_(**args)
             else:
                 logger.error("Unknown sensor type: '" + options.type + "'")
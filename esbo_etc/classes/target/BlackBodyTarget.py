@@ -1,12 +1,11 @@
 from ..target.ATarget import ATarget
 from ..SpectralQty import SpectralQty
 import astropy.units as u
-from astropy.modeling.models import BlackBody
 from astropy.constants import c, k_B
 from ...lib.logger import logger
+from ...lib.helpers import greyBody
 from ..Entry import Entry
 from typing import Union
-import numpy as np
 
 
 class BlackBodyTarget(ATarget):
@@ -55,7 +54,7 @@ class BlackBodyTarget(ATarget):
         # Create blackbody model with given temperature
         bb = None
         if law.lower() == "planck":
-            bb = BlackBody(temperature=temp, scale=1 * u.W / (u.m ** 2 * u.nm * u.sr))
+            bb = greyBody(temp.to(u.K, equivalencies=u.temperature()).value)
         elif law.upper() == "RJ":
             bb = self.__rayleigh_jeans_factory(temp)
         else:
@@ -41,8 +41,8 @@ class TargetFactory(ARadiantFactory):
         if parent is None:
             opts = self.collectOptions(options)
             opts["wl_bins"] = self._common_conf.wl_bins.val
-            if hasattr(tg, options.type):
-                class_ = getattr(tg, options.type)
+            class_ = getattr(tg, options.type, None)
+            if class_ is not None:
                 return class_(**opts)
             else:
                 logger.error("Unknown target type: '" + options.type + "'")
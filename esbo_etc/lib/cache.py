@@ -1,4 +1,11 @@
 import percache
+import atexit
+import os
 
-cache = percache.Cache("cache")
+# Keep the cache in the user's cache directory in order to share it between runs from different working directories
+cache_dir = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")), "esbo-etc")
+os.makedirs(cache_dir, exist_ok=True)
+# Write new entries immediately, so they persist even if the process doesn't shut down regularly
+cache = percache.Cache(os.path.join(cache_dir, "cache"), livesync=True)
 cache.clear(3600 * 24)
+atexit.register(cache.close)
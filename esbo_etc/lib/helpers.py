@@ -2,6 +2,9 @@ import numpy as np
 from astropy.io import ascii
 from astropy.table import Table
 import astropy.units as u
+from astropy.constants import h, c, k_B
+from typing import Callable, Union
+from functools import lru_cache
 import re
 
 
@@ -22,6 +25,94 @@ def isLambda(obj: object):
     return isinstance(obj, type(lambda: None)) and obj.__name__ == (lambda: None).__name__
 
 
+def planck(wl: np.ndarray, temp: Union[float, np.ndarray], em: Union[float, np.ndarray] = 1,
+           out: np.ndarray = None) -> np.ndarray:
+    """
+    Evaluate Planck's law for a grey body on plain arrays, avoiding the overhead of astropy's modeling framework.
+    The arguments are broadcast against each other.
+
+    Parameters
+    ----------
+    wl : ndarray
+        The wavelengths in nm.
+    temp : Union[float, ndarray]
+        The temperature of the grey body in Kelvin.
+    em : Union[float, ndarray]
+        The emissivity of the grey body.
+    out : ndarray
+        Optional preallocated buffer of the broadcast shape of the arguments to write the result to.
+
+    Returns
+    -------
+    rad : ndarray
+        The spectral radiance of the grey body in W / (m^2 nm sr).
+    """
+    wl = np.asarray(wl, dtype=np.float64)
+    if out is None:
+        out = np.empty(np.broadcast(wl, temp, em).shape)
+    # Evaluate the whole expression within the output buffer in order to avoid temporary arrays
+    with np.errstate(over="ignore", divide="ignore"):
+        np.multiply(wl, temp, out=out)
+        np.multiply(out, 1e-9 * k_B.value, out=out)
+        np.divide(h.value * c.value, out, out=out)
+        # expm1 avoids the cancellation of exp(x) - 1 for small exponents at long wavelengths
+        np.expm1(out, out=out)
+        np.multiply(out, np.power(wl, 5), out=out)
+        # Conversion from W / (m^3 sr) with wavelengths in m to W / (m^2 nm sr) with wavelengths in nm
+        np.divide(np.multiply(em, 2 * h.value * c.value ** 2 * 1e36), out, out=out)
+    return out
+
+
+@lru_cache(maxsize=256)
+def greyBody(temp: float, em: Union[int, float] = 1) -> Callable[[u.Quantity], u.Quantity]:
+    """
+    Create a grey body lambda-function. The function is shared between all callers using the same temperature and
+    emissivity.
+
+    Parameters
+    ----------
+    temp : float
+        The temperature of the grey body in Kelvin.
+    em : Union[int, float]
+        Emissivity of the the grey body
+
+    Returns
+    -------
+    bb : Callable
+        The lambda function for the grey body returning the spectral radiance in W / (m^2 nm sr).
+    """
+    # The wavelengths are converted to a plain float64 buffer in nm without copying them if they are already in nm
+    return lambda wl: _greyBodyEval(temp, em, wl.shape,
+                                    np.ascontiguousarray(wl.to_value(u.nm), dtype=np.float64).tobytes())
+
+
+@lru_cache(maxsize=64)
+def _greyBodyEval(temp: float, em: Union[int, float], shape: tuple, wl: bytes) -> u.Quantity:
+    """
+    Evaluate a grey body on a wavelength grid. The results are memoized, as the same wavelength grid is usually
+    evaluated by multiple components.
+
+    Parameters
+    ----------
+    temp : float
+        The temperature of the grey body in Kelvin.
+    em : Union[int, float]
+        Emissivity of the the grey body
+    shape : tuple
+        The shape of the wavelength grid.
+    wl : bytes
+        The raw float64 buffer of the wavelength grid in nm.
+
+    Returns
+    -------
+    rad : Quantity
+        The spectral radiance of the grey body. As it is shared between all callers, it is read-only.
+    """
+    rad = planck(np.frombuffer(wl).reshape(shape), temp, em)
+    rad.flags.writeable = False
+    return rad << u.W / (u.m ** 2 * u.nm * u.sr)
+
+
 def rasterizeCircle(grid: np.ndarray, radius: float, xc: float, yc: float):
     """
     Map a circle on a rectangular grid.
@@ -69,6 +160,55 @@ def rasterizeCircle(grid: np.ndarray, radius: float, xc: float, yc: float):
     return grid
 
 
+def encircledSum(grid: np.ndarray, xc: float, yc: float) -> Callable[[float], float]:
+    """
+    Create a function summing up the values of a grid within a circle of variable radius. The circle is mapped onto
+    the grid the same way as by `rasterizeCircle()`. As the pixels are sorted once by the radius from which on they
+    are contained in the circle, each evaluation only needs a binary search instead of rasterizing the circle.
+
+    Parameters
+    ----------
+    grid : ndarray
+        The grid to sum up.
+    xc : float
+        X-index of the circle's center point. The origin of the coordinate system is in the top left corner.
+    yc : float
+        Y-index of the circle's center point. The origin of the coordinate system is in the top left corner.
+
+    Returns
+    -------
+    sum : Callable[[float], float]
+        The function returning the sum of all grid values within the circle of the given radius.
+    """
+    xc_pix = int(round(xc))  # X center in pixel coordinates
+    x_shift = xc_pix - xc  # X shift of the circle center
+    yc_pix = int(round(yc))  # Y center in pixel coordinates
+    y_shift = yc_pix - yc  # Y shift of the circle center
+    dx = np.arange(grid.shape[1]).reshape(1, -1) - xc_pix
+    dy = np.arange(grid.shape[0]).reshape(-1, 1) - yc_pix
+    dx2 = (dx + x_shift) ** 2  # Square of the x-component of the current pixels radius
+    dx_side2 = (dx + x_shift + ((dx < 0) - 0.5)) ** 2  # Square of the x-component of the neighbouring pixels radius
+    dy2 = (dy + y_shift) ** 2  # Square of the y-component of the current pixels radius
+    dy_side2 = (dy + y_shift + ((dy < 0) - 0.5)) ** 2  # Square of the y-component of the neighbouring pixels radius
+    # A pixel is contained if either r^2 >= dx_side2 + dy2 or r^2 > dx2 + dy_side2. Only the smaller of both squared
+    # radii matters, together with the kind of the comparison.
+    r2_incl = dx_side2 + dy2
+    r2_excl = dx2 + dy_side2
+    inclusive = r2_incl <= r2_excl
+    # The center pixel is contained by default
+    r2_incl[yc_pix, xc_pix] = -np.inf
+    inclusive[yc_pix, xc_pix] = True
+
+    def sortedSum(r2: np.ndarray, values: np.ndarray):
+        order = np.argsort(r2, kind="stable")
+        return r2[order], np.concatenate(([0.0], np.cumsum(values[order])))
+
+    r2_incl, sum_incl = sortedSum(r2_incl[inclusive], grid[inclusive])
+    r2_excl, sum_excl = sortedSum(r2_excl[~inclusive], grid[~inclusive])
+    return lambda radius: sum_incl[np.searchsorted(r2_incl, radius ** 2, side="right")] + sum_excl[
+        np.searchsorted(r2_excl, radius ** 2, side="left")]
+
+
 def readCSV(file: str, units: list = None, format_: str = None) -> Table:
     """
     Read a CSV file and parse the units in the header
@@ -88,7 +228,19 @@ def readCSV(file: str, units: list = None, format_: str = None) -> Table:
         The read table as astropy Table object.
     """
     # Read the file
-    data = ascii.read(file, format=format_)
+    data = None
+    if format_ is None and not _isECSV(file):
+        # Try astropy's fast C reader for plain CSV files first in order to skip the slow format guessing
+        try:
+            data = ascii.read(file, format="csv", guess=False, fast_reader="force")
+        except Exception:
+            pass
+        # Fall back to the guessing reader if the header was not detected correctly, e.g. for headerless files where
+        # the first row of values would be used as column names
+        if data is not None and (len(data.columns) < 2 or any(_isNumber(x) for x in data.colnames)):
+            data = None
+    if data is None:
+        data = ascii.read(file, format=format_)
     # Check if units are given
     if data[data.colnames[0]].unit is None:
         # Convert values to float
@@ -117,3 +269,42 @@ def readCSV(file: str, units: list = None, format_: str = None) -> Table:
             for i in range(len(data.columns)):
                 data[data.colnames[i]].unit = units[i]
     return data
+
+
+def _isECSV(file: str) -> bool:
+    """
+    Check if a file is in astropy's enhanced CSV format, which needs to be read by the ECSV reader to parse the units
+
+    Parameters
+    ----------
+    file : str
+        The path to the file to check.
+
+    Returns
+    -------
+    res : bool
+        Result of the check
+    """
+    with open(file, "rb") as f:
+        return f.readline().lstrip(b"\xef\xbb\xbf").startswith(b"# %ECSV")
+
+
+def _isNumber(value: str) -> bool:
+    """
+    Check if a string can be converted to a number
+
+    Parameters
+    ----------
+    value : str
+        The string to check.
+
+    Returns
+    -------
+    res : bool
+        Result of the check
+    """
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
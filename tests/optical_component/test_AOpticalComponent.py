@@ -29,6 +29,11 @@ class TestAOpticalComponent(TestCase):
                          SpectralQty(self.wl, np.array([1.29074440e-17, 5.65909989e-18, 2.85372997e-18,
                                                         1.58973516e-18]) << u.W / (u.m ** 2 * u.nm)))
 
+    def test_calcSignal_repeated(self):
+        # The signal of the target must not be modified by the in place propagation
+        self.assertEqual(self.comp.calcSignal()[0], self.comp.calcSignal()[0])
+        self.assertEqual(self.comp.calcSignal()[0], self.target.calcSignal()[0] * 0.45)
+
     def test_calcBackground(self):
         self.assertEqual(self.comp.calcBackground(),
                          SpectralQty(self.wl, np.array([8.21976423e-05, 2.70268340e-04, 5.27503292e-04,
@@ -39,3 +44,30 @@ class TestAOpticalComponent(TestCase):
         self.assertEqual(comp.calcBackground(),
                          SpectralQty(self.wl, np.array([1.09186581e-04, 3.81889092e-04, 7.54879773e-04,
                                                         10.92866544e-04]) << u.W / (u.m ** 2 * u.nm * u.sr)))
+
+    def test_chain(self):
+        comp = OpticalComponent(self.comp, SpectralQty(self.wl, np.repeat(0.5, 4) << u.dimensionless_unscaled),
+                                SpectralQty(self.wl, np.repeat(0, 4) << u.W / (u.m ** 2 * u.nm * u.sr)))
+        self.assertEqual(comp.chain(), [self.target, self.comp, comp])
+        self.assertEqual(self.target.chain(), [self.target])
+
+    def test_stored(self):
+        self.assertIs(self.comp.calcBackground(), self.comp.calcBackground())
+        self.assertIs(self.comp.calcSignal(), self.comp.calcSignal())
+
+    def test_stepBackground_read_only(self):
+        # A read-only background handed down the chain must not be modified in place
+        background = SpectralQty(self.wl, np.repeat(1e-5, 4) << u.W / (u.m ** 2 * u.nm * u.sr))
+        self.comp._propagate = lambda rad: rad
+        expected = self.comp._stepBackground(SpectralQty(self.wl, background.qty.copy()))
+        background.qty.flags.writeable = False
+        self.assertEqual(self.comp._stepBackground(background), expected)
+        self.assertTrue(np.all(background.qty.value == 1e-5))
+
+    def test_calcBackground_source(self):
+        # The background of the source must not be modified by the in place propagation
+        background = SpectralQty(self.wl, np.repeat(1e-5, 4) << u.W / (u.m ** 2 * u.nm * u.sr))
+        self.target.calcBackground = lambda: background
+        self.comp.calcBackground()
+        self.assertTrue(background.qty.flags.writeable)
+        self.assertTrue(np.all(background.qty.value == 1e-5))
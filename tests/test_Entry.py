@@ -0,0 +1,21 @@
+from unittest import TestCase
+from esbo_etc.classes.Entry import Entry
+import astropy.units as u
+
+
+class TestEntry(TestCase):
+    def test_check_all(self):
+        checks = [("transmittance", "file_or_float", (), False), ("temp", "quantity", (u.K,), True)]
+        self.assertIsNone(Entry(transmittance="tests/data/lens/transmittance.csv").check_all(checks))
+        self.assertIsNone(Entry(transmittance="0.5").check_all(checks))
+        self.assertEqual(Entry(transmittance="file").check_all(checks),
+                         "Cannot convert parameter 'transmittance' with value 'file' to a numeric value.")
+        self.assertEqual(Entry().check_all(checks), "Parameter 'transmittance' not found.")
+        self.assertIsNotNone(Entry(transmittance="0.5", temp="x").check_all(checks))
+
+    def test_check_file_or_float(self):
+        conf = Entry(transmittance="0.5")
+        self.assertIsNone(conf.check_file_or_float("transmittance"))
+        self.assertEqual(conf.transmittance, 0.5)
+        self.assertIsNone(Entry(transmittance="tests/data/lens/transmittance.csv").check_file_or_float("transmittance"))
+        self.assertEqual(Entry().check_file_or_float("transmittance"), "Parameter 'transmittance' not found.")
@@ -43,6 +43,41 @@ class TestSpectralQty(TestCase):
         self.assertEqual(self.sqty * (lambda wl: 0.7 * u.dimensionless_unscaled),
                          SpectralQty(self.wl, self.qty * 0.7))
 
+    def test_copy(self):
+        sqty = self.sqty.copy()
+        self.assertEqual(sqty, self.sqty)
+        self.assertFalse(np.shares_memory(sqty.qty, self.sqty.qty))
+
+    def test_imul(self):
+        # In place
+        qty = self.qty.copy()
+        sqty = SpectralQty(self.wl, qty)
+        self.assertIs(sqty.imul(2), sqty)
+        self.assertEqual(sqty, SpectralQty(self.wl, self.qty * 2))
+        self.assertIs(sqty.imul(SpectralQty(self.wl, np.repeat(0.5, 4) << u.dimensionless_unscaled)), sqty)
+        self.assertEqual(sqty, SpectralQty(self.wl, self.qty))
+        # Out of place
+        sqty_2 = sqty.imul(2 * u.m)
+        self.assertIsNot(sqty_2, sqty)
+        self.assertEqual(sqty_2, SpectralQty(self.wl, self.qty * 2 * u.m))
+        qty.flags.writeable = False
+        self.assertIsNot(sqty.imul(2), sqty)
+
+    def test_iadd(self):
+        # In place
+        qty = self.qty.copy()
+        sqty = SpectralQty(self.wl, qty)
+        self.assertIs(sqty.iadd(1), sqty)
+        self.assertEqual(sqty, SpectralQty(self.wl, self.qty + 1 * self.qty.unit))
+        self.assertIs(sqty.iadd(SpectralQty(self.wl, np.repeat(-1e3, 4) << u.mW / (u.m ** 2 * u.nm))), sqty)
+        self.assertEqual(sqty, SpectralQty(self.wl, self.qty))
+        # Out of place
+        sqty_2 = sqty.iadd(SpectralQty(np.arange(200, 204, 0.5) << u.nm, np.repeat(1, 8) << self.qty.unit))
+        self.assertIsNot(sqty_2, sqty)
+        self.assertEqual(sqty_2, SpectralQty(self.wl, self.qty + 1 * self.qty.unit))
+        qty.flags.writeable = False
+        self.assertIsNot(sqty.iadd(1), sqty)
+
     def test___truediv__(self):
         # Integer
         self.assertEqual(self.sqty / 2, SpectralQty(np.arange(200, 204, 1) << u.nm,
@@ -94,6 +129,16 @@ class TestSpectralQty(TestCase):
         self.assertEqual(self.sqty - (lambda wl: 1 * u.W / (u.m ** 2 * u.nm ** 2) * wl),
                          SpectralQty(self.wl, np.array([-198.9, -199.8, -200.7, -201.6]) << u.W / (u.m ** 2 * u.nm)))
 
+    def test___rsub__(self):
+        # Quantity
+        self.assertEqual(2.0 * u.W / (u.m ** 2 * u.nm) - self.sqty,
+                         SpectralQty(self.wl, 2.0 * u.W / (u.m ** 2 * u.nm) - self.qty))
+        # Float
+        self.assertEqual(2.0 - self.sqty, SpectralQty(self.wl, 2.0 * u.W / (u.m ** 2 * u.nm) - self.qty))
+        # Lambda
+        self.assertEqual((lambda wl: 2.0 * np.ones(np.shape(wl)) << u.W / (u.m ** 2 * u.nm)) - self.sqty,
+                         SpectralQty(self.wl, 2.0 * u.W / (u.m ** 2 * u.nm) - self.qty))
+
     def test___add__(self):
         # Quantity
         self.assertEqual(self.sqty + 1.0 * u.W / (u.m ** 2 * u.nm),
@@ -143,6 +188,17 @@ class TestSpectralQty(TestCase):
         sqty_rebin = SpectralQty(self.wl, self.qty, fill_value=False).rebin(wl_new)
         self.assertEqual(sqty_rebin, sqty_res)
 
+        # Test reuse of the last rebinning
+        sqty = SpectralQty(self.wl, self.qty)
+        sqty_rebin = sqty.rebin(wl_new)
+        sqty_res = SpectralQty(sqty_rebin.wl, sqty_rebin.qty.copy())
+        self.assertTrue(sqty_rebin.qty.flags.writeable)
+        sqty_rebin.qty[:] = 0
+        self.assertEqual(sqty.rebin(wl_new), sqty_res)
+        # Modifying the grid in place must not return the result for the old grid
+        wl_new[:] = wl_new + 1 * u.nm
+        self.assertEqual(sqty.rebin(wl_new), SpectralQty(self.wl, self.qty).rebin(wl_new.copy()))
+
     def test_fromFile(self):
         sqty = SpectralQty.fromFile("tests/data/target/target_demo_1.csv", u.nm, u.W / (u.m ** 2 * u.nm))
         res = SpectralQty(np.arange(200, 210, 1) << u.nm,
@@ -152,6 +208,11 @@ class TestSpectralQty(TestCase):
         sqty = SpectralQty.fromFile("tests/data/target/target_demo_2.csv", u.nm, u.W / (u.m ** 2 * u.nm))
         self.assertEqual(sqty, res)
 
+        # Repeated reads share the read-only values of the file
+        sqty_2 = SpectralQty.fromFile("tests/data/target/target_demo_2.csv", u.nm, u.W / (u.m ** 2 * u.nm))
+        self.assertTrue(np.shares_memory(sqty.qty, sqty_2.qty))
+        self.assertFalse(sqty_2.qty.flags.writeable)
+
     def test_integrate(self):
         integral = self.sqty.integrate()
         self.assertAlmostEqual(integral.value, 3.75)
@@ -1,4 +1,7 @@
 from unittest import TestCase
+import os
+import shutil
+import tempfile
 from esbo_etc.classes.Config import Configuration, Entry
 import astropy.units as u
 
@@ -14,3 +17,24 @@ class TestConfiguration(TestCase):
         self.assertTrue({"wl_min", "wl_max", "wl_delta", "d_aperture", "jitter_sigma", "output_path",
                          "wl_bins"}.issubset(self.config.conf.common.__dir__()))
         self.assertTrue(self.config.conf.common.wl_min().unit.is_equivalent(u.meter))
+
+    def test_cache(self):
+        config = Configuration("tests/data/esbo-etc_defaults.xml")
+        self.assertIsNot(config.conf, self.config.conf)
+        self.assertTrue(u.allclose(config.conf.common.wl_bins(), self.config.conf.common.wl_bins()))
+
+    def test_cache_referenced_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            qe = os.path.join(tmp, "QE.csv")
+            shutil.copy("tests/data/ccd/QE.csv", qe)
+            file = os.path.join(tmp, "config.xml")
+            with open("tests/data/esbo-etc_defaults.xml") as f:
+                content = f.read().replace("tests/data/ccd/QE.csv", qe)
+            with open(file, "w") as f:
+                f.write(content)
+            Configuration(file)
+            Configuration(file)
+            # A deleted referenced file must be detected although the configuration file is unchanged
+            os.remove(qe)
+            with self.assertRaises(SystemExit):
+                Configuration(file)
@@ -1,6 +1,12 @@
 from unittest import TestCase
-from esbo_etc.lib.helpers import rasterizeCircle
+import os
+import tempfile
+from esbo_etc.lib.helpers import rasterizeCircle, planck, greyBody, readCSV, encircledSum
+from astropy.io import ascii
+from astropy.modeling.models import BlackBody
+import astropy.units as u
 import numpy as np
+from astropy.constants import c, k_B
 
 
 class Test(TestCase):
@@ -16,3 +22,50 @@ class Test(TestCase):
                             [0., 0., 0., 1., 1., 1., 1., 0.],
                             [0., 0., 0., 0., 0., 0., 0., 0.]])
         self.assertTrue((circ == circ_ex).all())
+
+    def test_encircled_sum(self):
+        grid = np.random.default_rng(0).random((20, 24))
+        for xc, yc in [(10, 12), (4.5, 3.8), (11.7, 9.2)]:
+            contained = encircledSum(grid, xc, yc)
+            for radius in [0, 0.5, 1, 2.6, 3.5, 7.3, 40]:
+                self.assertAlmostEqual(contained(radius), np.sum(grid * rasterizeCircle(np.zeros(grid.shape), radius,
+                                                                                        xc, yc)))
+
+    def test_planck(self):
+        wl = np.array([200, 500, 1000, 10000, 100000]) << u.nm
+        bb = BlackBody(temperature=300 * u.K, scale=0.5 * u.W / (u.m ** 2 * u.nm * u.sr))
+        self.assertTrue(np.allclose(planck(wl.value, 300, 0.5), bb(wl).value, rtol=1e-10, atol=0))
+        out = np.empty(5)
+        self.assertIs(planck(wl.value, 300, 0.5, out=out), out)
+        self.assertTrue(np.allclose(out, bb(wl).value, rtol=1e-10, atol=0))
+        # Rayleigh-Jeans limit at long wavelengths
+        wl = 1e12
+        self.assertAlmostEqual(planck(wl, 300) / (2 * c.value * k_B.value * 300 / (wl * 1e-9) ** 4 * 1e-9), 1, 6)
+
+    def test_grey_body(self):
+        wl = np.array([200, 500, 1000, 10000, 100000]) << u.nm
+        bb = BlackBody(temperature=300 * u.K, scale=0.5 * u.W / (u.m ** 2 * u.nm * u.sr))
+        self.assertIs(greyBody(300, 0.5), greyBody(300, 0.5))
+        self.assertTrue(np.allclose(greyBody(300, 0.5)(wl).value, bb(wl).value, rtol=1e-10, atol=0))
+        self.assertTrue(np.allclose(greyBody(300, 0.5)(wl.to(u.um)).value, bb(wl).value, rtol=1e-10, atol=0))
+
+    def test_read_csv(self):
+        for file in ["tests/data/atmosphere/atmosphere_transmittance_1.csv", "tests/data/atmosphere/transmittance.csv",
+                     "tests/data/ccd/PCO-Edge-42-QE.txt"]:
+            data = readCSV(file)
+            data_ex = ascii.read(file, format=None)
+            self.assertEqual(len(data), len(data_ex))
+            self.assertTrue(np.allclose(data[data.colnames[0]].value, data_ex[data_ex.colnames[0]]))
+            self.assertTrue(np.allclose(data[data.colnames[1]].value, data_ex[data_ex.colnames[1]]))
+        data = readCSV("tests/data/atmosphere/atmosphere_transmittance_1.csv", [u.nm, u.dimensionless_unscaled])
+        self.assertEqual(data[data.colnames[0]].unit, u.nm)
+        # Headerless CSV file
+        with tempfile.TemporaryDirectory() as tmp:
+            file = os.path.join(tmp, "headerless.csv")
+            with open(file, "w") as f:
+                f.write("400,1\n410,0.5\n420,0.25\n")
+            data = readCSV(file, [u.nm, u.dimensionless_unscaled])
+            self.assertEqual(len(data), 3)
+            self.assertTrue(np.allclose(data[data.colnames[0]].value, [400, 410, 420]))
+            self.assertTrue(np.allclose(data[data.colnames[1]].value, [1, 0.5, 0.25]))
+            self.assertEqual(data[data.colnames[0]].unit, u.nm)